@@ -0,0 +1,127 @@
+"""Páginas con varias métricas: siete tablas ('tablas') vs. formato largo ('unificado').
+
+Genera datos sintéticos (benchmarks/datos_sinteticos.py), los copia a la
+tabla 'medicion' con 'flask migrar-mediciones' y pide las mismas páginas con
+ALMACEN_MEDICIONES en cada modo:
+
+- /historial (primera página y una página con cursores),
+- /admin/registros/<id> (todas las lecturas de un usuario),
+- /admin/dashboard (actividad de una página de usuarios).
+
+Para cada página muestra p50/p95 y el número de sentencias SQL.
+
+Uso:
+    python benchmarks/almacen_mediciones.py [--usuarios 100] [--lecturas 200] [--peticiones 100]
+
+Usa una base SQLite temporal (DATABASE_URL), nunca la de la aplicación.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+_tmp = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+from sqlalchemy import event  # noqa: E402
+
+from app import HISTORIAL_CLAVES, METRIC_MODELS, Usuario, create_app, db, preparar_base_de_datos  # noqa: E402
+from datos_sinteticos import ADMIN, generar  # noqa: E402
+
+MODOS = ('tablas', 'unificado')
+
+
+def percentil(valores, q):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(q * len(valores)))]
+
+
+def cliente_con_sesion(app, usuario_id, rol):
+    cliente = app.test_client()
+    with cliente.session_transaction() as sesion:
+        sesion['usuario_id'] = usuario_id
+        sesion['rol'] = rol
+    return cliente
+
+
+def medir(app, urls_y_clientes):
+    """Latencias y sentencias SQL por petición de una lista de (cliente, url)."""
+    consultas = []
+
+    def contar(*args):
+        consultas[-1] += 1
+
+    with app.app_context():
+        motor = db.engine
+    event.listen(motor, 'before_cursor_execute', contar)
+    latencias = []
+    try:
+        for cliente, url in urls_y_clientes:
+            consultas.append(0)
+            inicio = time.perf_counter()
+            respuesta = cliente.get(url)
+            latencias.append(time.perf_counter() - inicio)
+            assert respuesta.status_code == 200, (url, respuesta.status_code)
+    finally:
+        event.remove(motor, 'before_cursor_execute', contar)
+    return latencias, consultas
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--usuarios', type=int, default=100)
+    parser.add_argument('--lecturas', type=int, default=200, help='Lecturas por métrica y usuario.')
+    parser.add_argument('--peticiones', type=int, default=100, help='Peticiones medidas por página y modo.')
+    parser.add_argument('--semilla', type=int, default=1)
+    args = parser.parse_args()
+
+    app = create_app('produccion')
+    with app.app_context():
+        preparar_base_de_datos()
+        pacientes = generar(args.usuarios, args.lecturas, args.semilla)
+        admin_id = Usuario.query.filter_by(nombre=ADMIN).one().id
+    resultado = app.test_cli_runner().invoke(args=['migrar-mediciones', '--lote', '500'])
+    print(resultado.output.strip().splitlines()[-1], '\n')
+
+    azar = random.Random(args.semilla)
+    muestra = [azar.choice(pacientes) for _ in range(args.peticiones)]
+    clientes = {p: cliente_con_sesion(app, p, 'user') for p in set(muestra)}
+    admin = cliente_con_sesion(app, admin_id, 'admin')
+    with app.app_context():
+        # Cursor de la tercera página (20 por página) de cada métrica, igual para los dos modos
+        cursores = {}
+        for p in set(muestra):
+            enlaces = {}
+            for clave, metrica in HISTORIAL_CLAVES.items():
+                Modelo = METRIC_MODELS[metrica]
+                fila = (Modelo.query.filter_by(usuario_id=p).order_by(Modelo.fecha.desc(), Modelo.id)
+                        .offset(40).first())
+                if fila:
+                    enlaces[f'cursor_{clave}'] = f"{fila.fecha.isoformat()}_{fila.id}"
+            cursores[p] = '&'.join(f'{k}={v}' for k, v in enlaces.items())
+
+    paginas = {
+        '/historial': [(clientes[p], '/historial') for p in muestra],
+        '/historial (cursores)': [(clientes[p], f'/historial?{cursores[p]}') for p in muestra],
+        '/admin/registros/<id>': [(admin, f'/admin/registros/{p}') for p in muestra],
+        '/admin/dashboard': [(admin, '/admin/dashboard')] * args.peticiones,
+    }
+
+    print(f"{args.usuarios} usuarios × {args.lecturas} lecturas por métrica, {args.peticiones} peticiones por página\n")
+    print(f"{'página':<24} {'modo':<10} {'p50 ms':>8} {'p95 ms':>8} {'consultas':>10}")
+    for pagina, peticiones in paginas.items():
+        for modo in MODOS:
+            app.config['ALMACEN_MEDICIONES'] = modo
+            medir(app, peticiones[:5])  # calentamiento
+            latencias, consultas = medir(app, peticiones)
+            print(f"{pagina:<24} {modo:<10} {percentil(latencias, 0.5) * 1000:8.2f} "
+                  f"{percentil(latencias, 0.95) * 1000:8.2f} {max(consultas):10d}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""Latencia (p50/p95/p99) y rendimiento de las rutas principales con datos sintéticos.
+
+Llena una base SQLite temporal con benchmarks/datos_sinteticos.py y pide
+cada ruta --peticiones veces desde --hilos hilos, cada uno con su propio
+cliente y su sesión ya iniciada (el inicio de sesión no se mide). Los
+pacientes y los usuarios de /admin/registros/<id> se eligen al azar con
+--semilla, así que dos ejecuciones con los mismos parámetros piden lo mismo.
+
+El resultado se guarda en JSON (--salida) junto con los parámetros, el
+commit y el entorno, para comparar ejecuciones entre cambios.
+
+Uso:
+    python benchmarks/carga_rutas.py [--usuarios 200] [--lecturas 50]
+        [--peticiones 200] [--hilos 1] [--rutas /historial /estadisticas]
+        [--salida resultados_carga.json]
+
+Usa una base SQLite temporal (DATABASE_URL), nunca la de la aplicación.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+_tmp = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+import sqlalchemy  # noqa: E402
+
+from app import METRIC_MODELS, Usuario, create_app, db, preparar_base_de_datos  # noqa: E402
+from datos_sinteticos import ADMIN, generar  # noqa: E402
+
+# Ruta -> rol de la sesión con que se pide ('<id>' se sustituye por un paciente al azar)
+RUTAS = {
+    '/': 'user',
+    '/historial': 'user',
+    '/estadisticas': 'user',
+    '/calcular_imc': 'user',
+    '/consejos': 'user',
+    '/admin/dashboard': 'admin',
+    '/admin/registros/<id>': 'admin',
+}
+CALENTAMIENTO = 5
+
+
+def percentil(valores, q):
+    if not valores:
+        return float('nan')
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(q * len(valores)))]
+
+
+def commit_actual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def cliente_con_sesion(app, usuario_id, rol):
+    cliente = app.test_client()
+    with cliente.session_transaction() as sesion:
+        sesion['usuario_id'] = usuario_id
+        sesion['rol'] = rol
+    return cliente
+
+
+def medir_ruta(app, ruta, rol, pacientes, admin_id, peticiones, hilos, semilla):
+    """Pide la ruta 'peticiones' veces repartidas entre 'hilos' hilos."""
+    latencias, errores = [], []
+    lock = threading.Lock()
+
+    def trabajador(indice, cuantas):
+        azar = random.Random(semilla * 1000 + indice)
+        clientes = {}
+
+        def pedir():
+            paciente = azar.choice(pacientes)
+            if rol == 'admin':
+                usuario_id, url = admin_id, ruta.replace('<id>', str(paciente))
+            else:
+                usuario_id, url = paciente, ruta
+            if usuario_id not in clientes:
+                clientes[usuario_id] = cliente_con_sesion(app, usuario_id, rol)
+            inicio = time.perf_counter()
+            respuesta = clientes[usuario_id].get(url)
+            return time.perf_counter() - inicio, respuesta.status_code
+
+        for _ in range(CALENTAMIENTO):
+            pedir()
+        listo.wait()
+        for _ in range(cuantas):
+            duracion, estado = pedir()
+            with lock:
+                latencias.append(duracion)
+                if estado != 200:
+                    errores.append(estado)
+
+    listo = threading.Barrier(hilos + 1)
+    reparto = [peticiones // hilos + (1 if i < peticiones % hilos else 0) for i in range(hilos)]
+    trabajadores = [threading.Thread(target=trabajador, args=(i, n)) for i, n in enumerate(reparto)]
+    for hilo in trabajadores:
+        hilo.start()
+    listo.wait()
+    inicio = time.perf_counter()
+    for hilo in trabajadores:
+        hilo.join()
+    total = time.perf_counter() - inicio
+
+    return {
+        'peticiones': len(latencias),
+        'errores': len(errores),
+        'estados_error': sorted(set(errores)),
+        'p50_ms': round(percentil(latencias, 0.50) * 1000, 3),
+        'p95_ms': round(percentil(latencias, 0.95) * 1000, 3),
+        'p99_ms': round(percentil(latencias, 0.99) * 1000, 3),
+        'media_ms': round(sum(latencias) / len(latencias) * 1000, 3) if latencias else None,
+        'peticiones_por_segundo': round(len(latencias) / total, 2) if total else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--usuarios', type=int, default=200)
+    parser.add_argument('--lecturas', type=int, default=50, help='Lecturas por métrica y usuario.')
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--peticiones', type=int, default=200, help='Peticiones medidas por ruta.')
+    parser.add_argument('--hilos', type=int, default=1)
+    parser.add_argument('--rutas', nargs='+', choices=list(RUTAS), default=list(RUTAS))
+    parser.add_argument('--perfil', default='produccion', help='Perfil de config.PERFILES.')
+    parser.add_argument('--salida', default='resultados_carga.json')
+    args = parser.parse_args()
+
+    app = create_app(args.perfil)
+    with app.app_context():
+        preparar_base_de_datos()
+        inicio = time.perf_counter()
+        pacientes = generar(args.usuarios, args.lecturas, args.semilla)
+        segundos_generacion = time.perf_counter() - inicio
+        admin_id = Usuario.query.filter_by(nombre=ADMIN).one().id
+        motor = db.engine.dialect.name
+    print(f"{args.usuarios} usuarios × {args.lecturas} lecturas por métrica generados "
+          f"en {segundos_generacion:.1f} s\n")
+
+    rutas = {}
+    print(f"{'ruta':<24} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'pet/s':>9}  errores")
+    for ruta in args.rutas:
+        r = medir_ruta(app, ruta, RUTAS[ruta], pacientes, admin_id, args.peticiones, args.hilos, args.semilla)
+        rutas[ruta] = r
+        print(f"{ruta:<24} {r['p50_ms']:9.2f} {r['p95_ms']:9.2f} {r['p99_ms']:9.2f} "
+              f"{r['peticiones_por_segundo']:9.1f}  {r['errores']}")
+
+    resultado = {
+        'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit_actual(),
+        'parametros': {
+            'usuarios': args.usuarios, 'lecturas_por_metrica': args.lecturas,
+            'lecturas_totales': args.usuarios * args.lecturas * len(METRIC_MODELS),
+            'semilla': args.semilla, 'peticiones': args.peticiones, 'hilos': args.hilos,
+            'perfil': args.perfil,
+        },
+        'entorno': {
+            'python': platform.python_version(), 'sqlalchemy': sqlalchemy.__version__,
+            'motor': motor, 'plataforma': platform.platform(), 'nucleos': os.cpu_count(),
+        },
+        'generacion_segundos': round(segundos_generacion, 3),
+        'rutas': rutas,
+    }
+    with open(args.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(resultado, archivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {args.salida}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""Generador determinista de datos sintéticos: N usuarios × M lecturas por métrica.
+
+Cada usuario tiene edad, sexo y una línea base propia por campo, y sus
+lecturas oscilan alrededor de ella con ruido y una tendencia lenta, siempre dentro de los rangos de app.MODELS_MAP. Las fechas
+se reparten en los últimos --dias días con huecos irregulares y horas
+concentradas por la mañana y por la noche, como las de alguien que se mide
+en casa. Con la misma semilla se obtienen exactamente los mismos datos.
+
+Las lecturas se insertan con un executemany por tabla y después las tablas
+derivadas se reconstruyen de una vez con las mismas funciones que los
+comandos reconstruir-ultimo-registro, rellenar-rollups y (con
+ALMACEN_MEDICIONES=unificado o MEDICIONES_DOBLE_ESCRITURA=1)
+migrar-mediciones, más agregados y cuantiles por usuario: mantenerlas fila
+a fila, como en la importación, sería varias veces más lento sin cambiar el
+resultado.
+
+Uso (sobre la base de DATABASE_URL / MYSQL_*, ¡no la de producción!):
+    python benchmarks/datos_sinteticos.py --usuarios 200 --lecturas 50 [--semilla 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import click  # noqa: E402
+
+from app import (MODELS_MAP, CAMPOS_METRICA, ESTADISTICAS_CAMPOS, METRIC_MODELS, Consejo,  # noqa: E402
+                 Usuario, db, hashear_password, indexar_consejo, medicion_al_dia, migrar_mediciones,
+                 obtener_estadisticas, reconstruir_cuantil, reconstruir_ultimo_registro, rellenar_rollups)
+
+PASSWORD = 'bench'
+ADMIN = 'admin_bench'
+
+# Media y desviación de la línea base entre usuarios, y ruido entre lecturas
+BASES = {
+    'ritmo_cardiaco': (72, 9, 6),
+    'presion_sistolica': (122, 14, 8),
+    'presion_diastolica': (79, 9, 5),
+    'nivel_azucar': (98, 18, 12),
+    'colesterol': (192, 32, 10),
+    'oxigeno_sangre': (97, 1.2, 1),
+    'peso': (72, 14, 0.6),
+    'altura': (168, 9, 0.3),
+}
+HORAS = [7, 7, 8, 8, 8, 9, 13, 19, 20, 21, 21, 22]
+TEMAS = ['Nutrición', 'Ejercicio', 'Sueño', 'Estrés', 'Higiene', 'Diabetes', 'General']
+PALABRAS = ('salud descanso agua fruta verdura caminar dormir presión azúcar corazón '
+            'control médico hábito rutina energía estrés respiración peso').split()
+
+
+def acotar(campo, valor):
+    config = MODELS_MAP[campo]
+    valor = min(config['max'], max(config['min'], valor))
+    return config['type'](round(valor) if config['type'] is int else round(valor, 1))
+
+
+def fechas(azar, n, dias, ahora):
+    """n instantes en los últimos 'dias' días, con huecos irregulares."""
+    # Tiempos entre lecturas exponenciales: rachas de días seguidos y pausas largas
+    pasos = [azar.expovariate(1.0) for _ in range(n)]
+    escala = dias / (sum(pasos) or 1)
+    resultado, dia = [], 0.0
+    for paso in pasos:
+        dia += paso * escala
+        base = ahora - timedelta(days=dias - dia)
+        resultado.append(datetime(base.year, base.month, base.day, azar.choice(HORAS),
+                                  azar.randrange(60), azar.randrange(60)))
+    return resultado
+
+
+def lecturas_de_usuario(azar, usuario_id, lecturas, dias, ahora):
+    """{metrica: [fila, ...]} con las lecturas de un usuario."""
+    base = {campo: azar.gauss(media, desviacion) for campo, (media, desviacion, _) in BASES.items()}
+    tendencia = azar.gauss(0, 0.02)  # desviaciones por lectura (p. ej. subir de peso poco a poco)
+    filas = {}
+    for metrica, campos in CAMPOS_METRICA.items():
+        for i, fecha in enumerate(fechas(azar, lecturas, dias, ahora)):
+            fila = {'usuario_id': usuario_id, 'fecha': fecha}
+            for campo, columna in campos:
+                _, _, ruido = BASES[campo]
+                fila[columna] = acotar(campo, base[campo] + ruido * (azar.gauss(0, 1) + tendencia * i))
+            filas.setdefault(metrica, []).append(fila)
+    return filas
+
+
+def generar(usuarios, lecturas, semilla=1, dias=365, consejos=30, lote_usuarios=50, ahora=None):
+    """Crea los usuarios (paciente0..N-1 y admin_bench), sus lecturas y consejos.
+
+    Debe llamarse dentro de app.app_context() sobre una base vacía. Devuelve
+    los ids de los pacientes.
+    """
+    azar = random.Random(semilla)
+    ahora = ahora or datetime(2025, 1, 1)
+    password_hash = hashear_password(PASSWORD)  # uno para todos: el coste del hash no es lo que se mide
+
+    admin = Usuario(nombre=ADMIN, email=f'{ADMIN}@bench', rol='admin', password_hash=password_hash)
+    db.session.add(admin)
+    ids = []
+    for inicio in range(0, usuarios, lote_usuarios):
+        nuevos = [Usuario(nombre=f'paciente{i}', email=f'paciente{i}@bench', rol='user',
+                          edad=azar.randint(18, 90), sexo=azar.choice(['masculino', 'femenino']),
+                          telefono=f'3{azar.randrange(10 ** 9):09d}', password_hash=password_hash)
+                  for i in range(inicio, min(usuarios, inicio + lote_usuarios))]
+        db.session.add_all(nuevos)
+        db.session.flush()
+        filas = {}
+        for usuario in nuevos:
+            for metrica, lista in lecturas_de_usuario(azar, usuario.id, lecturas, dias, ahora).items():
+                filas.setdefault(metrica, []).extend(lista)
+            ids.append(usuario.id)
+        for metrica, lista in filas.items():
+            db.session.execute(db.insert(METRIC_MODELS[metrica]), lista)
+        db.session.commit()
+
+    reconstruir_derivadas(ids)
+
+    for i in range(consejos):
+        consejo = Consejo(titulo=' '.join(azar.sample(PALABRAS, 3)).capitalize(),
+                          contenido=' '.join(azar.choices(PALABRAS, k=120)),
+                          tema=azar.choice(TEMAS), usuario_admin_id=admin.id,
+                          fecha=ahora - timedelta(days=azar.randrange(dias)))
+        db.session.add(consejo)
+        indexar_consejo(consejo)
+    db.session.commit()
+    return ids
+
+
+def reconstruir_derivadas(ids):
+    """Último registro, rollups, agregados y cuantiles de los usuarios generados."""
+    comandos = [reconstruir_ultimo_registro, rellenar_rollups]
+    if medicion_al_dia():
+        comandos.append(migrar_mediciones)
+    for comando in comandos:
+        click.Context(comando).invoke(comando)
+    for usuario_id in ids:
+        obtener_estadisticas(usuario_id)  # base vacía: los inicializa desde las tablas originales
+        for campo, _ in ESTADISTICAS_CAMPOS:
+            reconstruir_cuantil(usuario_id, campo)
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--usuarios', type=int, default=200)
+    parser.add_argument('--lecturas', type=int, default=50, help='Lecturas por métrica y usuario.')
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--dias', type=int, default=365)
+    args = parser.parse_args()
+
+    from app import create_app, preparar_base_de_datos
+    app = create_app(os.environ.get('APP_PERFIL', 'desarrollo'))
+    with app.app_context():
+        preparar_base_de_datos()
+        if Usuario.query.first() is not None:
+            sys.exit('La base de datos ya tiene usuarios; usa una vacía (DATABASE_URL).')
+        inicio = time.perf_counter()
+        generar(args.usuarios, args.lecturas, args.semilla, args.dias)
+        total = args.usuarios * args.lecturas * len(METRIC_MODELS)
+        print(f"✅ {args.usuarios} usuarios y {total} lecturas en {time.perf_counter() - inicio:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Tendencias de /estadisticas: NumPy sobre el cursor vs. bucle de Python sobre el ORM.
+
+Genera datos sintéticos (benchmarks/datos_sinteticos.py) y, para una muestra
+de usuarios, calcula los indicadores de series.py de dos maneras:
+
+- 'numpy': app.series_de_usuario (una consulta, filas del cursor a arrays)
+  y series.indicadores, como hace /estadisticas.
+- 'python': una consulta del ORM por métrica y los mismos indicadores con
+  bucles de Python sobre los objetos.
+
+Comprueba que los dos dan el mismo resultado y muestra p50/p95 por usuario.
+
+Uso:
+    python benchmarks/estadisticas_series.py [--usuarios 50] [--lecturas 2000] [--muestra 50]
+
+Usa una base SQLite temporal (DATABASE_URL), nunca la de la aplicación.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+_tmp = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+from app import (CAMPOS_METRICA, METRIC_MODELS, TENDENCIAS_DIAS, TENDENCIAS_VENTANA, create_app,  # noqa: E402
+                 preparar_base_de_datos, series_de_usuario)
+from datos_sinteticos import generar  # noqa: E402
+from series import SEGUNDOS_DIA, indicadores  # noqa: E402
+
+
+def percentil(valores, q):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(q * len(valores)))]
+
+
+def con_numpy(usuario_id):
+    return {metrica: indicadores(tiempos, valores, ventana=TENDENCIAS_VENTANA)
+            for metrica, (tiempos, valores) in series_de_usuario(usuario_id).items()}
+
+
+def indicadores_python(tiempos, columnas, ventana, dias_cambio=30):
+    """Los indicadores de series.indicadores con listas y bucles."""
+    n = len(tiempos)
+    dias = [(t - tiempos[0]) / SEGUNDOS_DIA for t in tiempos]
+    media_x = sum(dias) / n
+    sxx = sum((x - media_x) ** 2 for x in dias)
+    limite = tiempos[-1] - dias_cambio * SEGUNDOS_DIA
+    resultado = {k: [] for k in ('promedio', 'desviacion', 'pendiente_dia', 'r2', 'media_movil', 'cambio_periodo')}
+    for valores in columnas:
+        promedio = sum(valores) / n
+        syy = sum((y - promedio) ** 2 for y in valores)
+        sxy = sum((x - media_x) * (y - promedio) for x, y in zip(dias, valores))
+        pendiente = sxy / sxx if sxx else 0.0
+        reciente = [y for t, y in zip(tiempos, valores) if t > limite]
+        anterior = [y for t, y in zip(tiempos, valores) if limite - dias_cambio * SEGUNDOS_DIA < t <= limite]
+        ultimas = valores[-min(ventana, n):]
+        resultado['promedio'].append(promedio)
+        resultado['desviacion'].append(math.sqrt(syy / (n - 1)) if n > 1 else 0.0)
+        resultado['pendiente_dia'].append(pendiente)
+        resultado['r2'].append(pendiente ** 2 * sxx / syy if sxx and syy else 0.0)
+        resultado['media_movil'].append(sum(ultimas) / len(ultimas))
+        resultado['cambio_periodo'].append(sum(reciente) / len(reciente) - sum(anterior) / len(anterior)
+                                           if reciente and anterior else math.nan)
+    resultado['conteo'] = n
+    resultado['dias'] = dias[-1]
+    return resultado
+
+
+def con_python(usuario_id):
+    desde = datetime.utcnow() - timedelta(days=TENDENCIAS_DIAS)
+    resultado = {}
+    for metrica, Modelo in METRIC_MODELS.items():
+        registros = (Modelo.query.filter(Modelo.usuario_id == usuario_id, Modelo.fecha >= desde)
+                     .order_by(Modelo.fecha).all())
+        if not registros:
+            continue
+        tiempos = [r.fecha.replace(tzinfo=timezone.utc).timestamp() for r in registros]
+        columnas = [[float(getattr(r, columna)) for r in registros] for _, columna in CAMPOS_METRICA[metrica]]
+        resultado[metrica] = indicadores_python(tiempos, columnas, TENDENCIAS_VENTANA)
+    return resultado
+
+
+def comparar(a, b):
+    assert a.keys() == b.keys(), (a.keys(), b.keys())
+    for metrica in a:
+        assert a[metrica]['conteo'] == b[metrica]['conteo']
+        for clave in ('promedio', 'desviacion', 'pendiente_dia', 'r2', 'media_movil', 'cambio_periodo'):
+            for x, y in zip(a[metrica][clave], b[metrica][clave]):
+                assert (math.isnan(x) and math.isnan(y)) or math.isclose(x, y, rel_tol=1e-6, abs_tol=1e-6), \
+                    (metrica, clave, x, y)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--usuarios', type=int, default=50)
+    parser.add_argument('--lecturas', type=int, default=2000, help='Lecturas por métrica y usuario.')
+    parser.add_argument('--muestra', type=int, default=50, help='Usuarios medidos con cada método.')
+    parser.add_argument('--semilla', type=int, default=1)
+    args = parser.parse_args()
+
+    app = create_app('produccion')
+    with app.app_context():
+        preparar_base_de_datos()
+        # Las lecturas se reparten en TENDENCIAS_DIAS días para que todas entren en la ventana
+        pacientes = generar(args.usuarios, args.lecturas, args.semilla, dias=TENDENCIAS_DIAS - 1,
+                            ahora=datetime.utcnow())
+
+        muestra = random.Random(args.semilla).sample(pacientes, min(args.muestra, len(pacientes)))
+        comparar(con_numpy(muestra[0]), con_python(muestra[0]))
+
+        print(f"{args.usuarios} usuarios × {args.lecturas} lecturas por métrica, {len(muestra)} usuarios medidos\n")
+        print(f"{'método':<8} {'p50 ms':>8} {'p95 ms':>8}")
+        for nombre, funcion in (('numpy', con_numpy), ('python', con_python)):
+            latencias = []
+            for usuario_id in muestra:
+                inicio = time.perf_counter()
+                funcion(usuario_id)
+                latencias.append(time.perf_counter() - inicio)
+            print(f"{nombre:<8} {percentil(latencias, 0.5) * 1000:8.2f} {percentil(latencias, 0.95) * 1000:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Compara la inserción por formulario (una petición y un commit por lectura)
+con la API de lotes POST /api/v1/mediciones/lote.
+
+Uso:
+    python benchmarks/ingesta_lote.py [--lecturas 500]
+
+Usa una base SQLite temporal (DATABASE_URL), nunca la de la aplicación.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+_tmp = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+from app import create_app, db, Usuario  # noqa: E402
+
+app = create_app()
+
+
+def crear_usuario(nombre):
+    usuario = Usuario(nombre=nombre, email=f'{nombre}@bench', edad=40, sexo='femenino', rol='user')
+    usuario.set_password('bench')
+    db.session.add(usuario)
+    db.session.commit()
+
+
+def cliente_con_sesion(nombre):
+    cliente = app.test_client()
+    cliente.post('/login', data={'nameUser': nombre, 'passwordUser': 'bench'})
+    return cliente
+
+
+def lecturas(n, semilla=1):
+    azar = random.Random(semilla)
+    return [{'metrica': 'ritmo_cardiaco', 'valor': azar.randint(50, 120)} for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lecturas', type=int, default=500)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        crear_usuario('formulario')
+        crear_usuario('lote')
+
+    datos = lecturas(args.lecturas)
+
+    cliente = cliente_con_sesion('formulario')
+    inicio = time.perf_counter()
+    for item in datos:
+        cliente.post('/agregar/ritmo_cardiaco', data={'valor': str(item['valor'])})
+    t_formulario = time.perf_counter() - inicio
+
+    cliente = cliente_con_sesion('lote')
+    inicio = time.perf_counter()
+    for i in range(0, len(datos), 1000):
+        respuesta = cliente.post('/api/v1/mediciones/lote', json={'mediciones': datos[i:i + 1000]})
+        assert respuesta.status_code == 201, respuesta.get_json()
+    t_lote = time.perf_counter() - inicio
+
+    n = len(datos)
+    print(f"Formulario: {n} lecturas en {t_formulario:.2f} s ({n / t_formulario:,.0f} lecturas/s)")
+    print(f"Lote:       {n} lecturas en {t_lote:.2f} s ({n / t_lote:,.0f} lecturas/s)")
+    print(f"Aceleración: x{t_formulario / t_lote:.1f}")
+
+
+if __name__ == '__main__':
+    main()
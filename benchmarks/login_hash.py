@@ -0,0 +1,93 @@
+"""Inicios de sesión por segundo (y por núcleo) según el método de hash.
+
+1. Coste de verificar una contraseña con cada método, en un solo núcleo.
+2. Inicios de sesión completos (POST /login) desde 1 y desde --hilos hilos;
+   hashlib libera el GIL, así que con varios hilos se usan varios núcleos.
+   Con un solo núcleo disponible los hilos no escalan: el resultado sólo
+   indica cuánto espera cada petición por el hash, no la capacidad del
+   servidor de producción.
+
+Uso:
+    python benchmarks/login_hash.py [--logins 60] [--hilos 8]
+        [--metodos pbkdf2:sha256:1000000 scrypt:32768:8:1]
+
+Usa una base SQLite temporal (DATABASE_URL), nunca la de la aplicación.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+_tmp = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+from werkzeug.security import generate_password_hash, check_password_hash  # noqa: E402
+
+from app import create_app, db, Usuario  # noqa: E402
+
+app = create_app()
+
+NUCLEOS = os.cpu_count() or 1
+
+
+def verificaciones_por_segundo(metodo, repeticiones=20):
+    password_hash = generate_password_hash('bench', metodo)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        check_password_hash(password_hash, 'bench')
+    return repeticiones / (time.perf_counter() - inicio)
+
+
+def preparar_usuarios(metodo, n):
+    app.config['PASSWORD_HASH_METODO'] = metodo
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        for i in range(n):
+            usuario = Usuario(nombre=f'u{i}', email=f'u{i}@bench', rol='user')
+            usuario.set_password('bench')  # fuera de una petición: en el hilo actual
+            db.session.add(usuario)
+        db.session.commit()
+
+
+def iniciar_sesion(i):
+    cliente = app.test_client()
+    respuesta = cliente.post('/login', data={'nameUser': f'u{i}', 'passwordUser': 'bench'})
+    assert respuesta.status_code == 302, respuesta.status_code
+
+
+def logins_por_segundo(logins, hilos):
+    iniciar_sesion(0)  # calentamiento
+    with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+        inicio = time.perf_counter()
+        list(ejecutor.map(iniciar_sesion, range(logins)))
+        return logins / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logins', type=int, default=60)
+    parser.add_argument('--hilos', type=int, default=8)
+    parser.add_argument('--metodos', nargs='+', default=['pbkdf2:sha256:1000000', 'scrypt:32768:8:1'])
+    args = parser.parse_args()
+
+    print(f"Núcleos: {NUCLEOS}\n")
+    print("Verificación de contraseña en un núcleo:")
+    for metodo in args.metodos:
+        print(f"  {metodo:<24} {verificaciones_por_segundo(metodo):8.1f} verificaciones/s")
+
+    print(f"\nPOST /login ({args.logins} inicios de sesión):")
+    for metodo in args.metodos:
+        preparar_usuarios(metodo, args.logins)
+        for hilos in sorted({1, args.hilos}):
+            tasa = logins_por_segundo(args.logins, hilos)
+            print(f"  {metodo:<24} {hilos:3d} hilos {tasa:8.1f} logins/s  ({tasa / min(hilos, NUCLEOS):6.1f} por núcleo)")
+
+
+if __name__ == '__main__':
+    main()
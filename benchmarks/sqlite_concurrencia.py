@@ -0,0 +1,130 @@
+"""Escritores y lectores concurrentes sobre SQLite: sin ajustes vs. SQLITE_PRAGMAS.
+
+Cada escritor inserta lecturas de ritmo cardiaco de una en una, con un commit
+por lectura (como el formulario). Cada lector pide una y otra vez las últimas
+20 lecturas de un usuario (como /historial). Se comparan:
+
+- 'sin ajustes': journal por defecto (DELETE), synchronous=FULL y la espera
+  por bloqueo por defecto de sqlite3 (5 s).
+- 'perfil': los PRAGMA de config.Config.SQLITE_PRAGMAS (WAL, NORMAL, ...).
+
+Uso:
+    python benchmarks/sqlite_concurrencia.py [--escritores 4] [--lectores 4] [--segundos 5]
+
+Usa bases SQLite temporales, nunca la de la aplicación.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from sqlalchemy import create_engine, event, select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app import RitmoCardiaco, Usuario, configurar_sqlite, opciones_motor  # noqa: E402
+from config import Config  # noqa: E402
+
+USUARIOS = 50
+
+
+def crear_motor(ruta, pragmas):
+    config = {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{ruta}',
+        'DB_POOL_SIZE': 16, 'DB_MAX_OVERFLOW': 0,
+        'DB_POOL_TIMEOUT': 20, 'DB_POOL_RECYCLE': 180,
+    }
+    motor = create_engine(config['SQLALCHEMY_DATABASE_URI'], **opciones_motor(config))
+    if pragmas:
+        event.listen(motor, 'connect', lambda conexion, registro: configurar_sqlite(conexion, pragmas))
+    Usuario.__table__.create(motor)
+    RitmoCardiaco.__table__.create(motor)
+    with motor.begin() as conexion:
+        conexion.execute(Usuario.__table__.insert(), [
+            {'id': i, 'nombre': f'u{i}', 'email': f'u{i}@bench', 'password_hash': 'x'} for i in range(1, USUARIOS + 1)
+        ])
+    return motor
+
+
+def percentil(valores, q):
+    if not valores:
+        return float('nan')
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(q * len(valores)))]
+
+
+def ejecutar(motor, escritores, lectores, segundos):
+    tabla = RitmoCardiaco.__table__
+    fin = time.monotonic() + segundos
+    resultados = {'escrituras': 0, 'lecturas': 0, 'errores': 0, 'latencias_lectura': [], 'latencias_escritura': []}
+    lock = threading.Lock()
+
+    def escritor(semilla):
+        azar = random.Random(semilla)
+        while time.monotonic() < fin:
+            inicio = time.perf_counter()
+            try:
+                with motor.begin() as conexion:
+                    conexion.execute(tabla.insert().values(
+                        usuario_id=azar.randint(1, USUARIOS), valor=azar.randint(50, 120), fecha=datetime.utcnow()))
+            except OperationalError:
+                with lock:
+                    resultados['errores'] += 1
+                continue
+            with lock:
+                resultados['escrituras'] += 1
+                resultados['latencias_escritura'].append(time.perf_counter() - inicio)
+
+    def lector(semilla):
+        azar = random.Random(semilla)
+        while time.monotonic() < fin:
+            consulta = (select(tabla).where(tabla.c.usuario_id == azar.randint(1, USUARIOS))
+                        .order_by(tabla.c.fecha.desc()).limit(20))
+            inicio = time.perf_counter()
+            try:
+                with motor.connect() as conexion:
+                    conexion.execute(consulta).all()
+            except OperationalError:
+                with lock:
+                    resultados['errores'] += 1
+                continue
+            with lock:
+                resultados['lecturas'] += 1
+                resultados['latencias_lectura'].append(time.perf_counter() - inicio)
+
+    hilos = [threading.Thread(target=escritor, args=(i,)) for i in range(escritores)]
+    hilos += [threading.Thread(target=lector, args=(100 + i,)) for i in range(lectores)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--escritores', type=int, default=4)
+    parser.add_argument('--lectores', type=int, default=4)
+    parser.add_argument('--segundos', type=float, default=5)
+    args = parser.parse_args()
+
+    carpeta = tempfile.mkdtemp()
+    print(f"{args.escritores} escritores y {args.lectores} lectores durante {args.segundos:g} s\n")
+    for nombre, pragmas in [('sin ajustes', None), ('perfil', Config.SQLITE_PRAGMAS)]:
+        motor = crear_motor(os.path.join(carpeta, f"{nombre.replace(' ', '_')}.db"), pragmas)
+        r = ejecutar(motor, args.escritores, args.lectores, args.segundos)
+        motor.dispose()
+        print(f"{nombre}:")
+        print(f"  escrituras: {r['escrituras'] / args.segundos:8.1f}/s   p95 {percentil(r['latencias_escritura'], 0.95) * 1000:7.1f} ms")
+        print(f"  lecturas:   {r['lecturas'] / args.segundos:8.1f}/s   p95 {percentil(r['latencias_lectura'], 0.95) * 1000:7.1f} ms")
+        print(f"  errores 'database is locked': {r['errores']}\n")
+
+
+if __name__ == '__main__':
+    main()
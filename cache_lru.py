@@ -0,0 +1,69 @@
+"""Caché en memoria con tamaño máximo, expulsión LRU y caducidad opcional.
+
+Pensada para datos que cambian poco y se leen mucho (el listado de consejos).
+La invalidación se hace por versión: quien modifica los datos llama a
+invalidar(), que incrementa la versión y vacía la caché; las claves se
+guardan junto con la versión con la que se calcularon, de modo que un valor
+calculado durante una invalidación concurrente no vuelve a servirse.
+
+Cada proceso tiene su propia caché; con varios procesos la caducidad (ttl)
+acota el tiempo que un proceso puede servir datos ya invalidados en otro.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheLRU:
+    def __init__(self, max_entradas=128, ttl=None):
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self.version = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, clave, calcular):
+        """Devuelve el valor de 'clave'; si no está (o caducó) lo calcula con calcular()."""
+        ahora = time.monotonic()
+        with self._lock:
+            version = self.version
+            entrada = self._datos.get((version, clave))
+            if entrada is not None and (self.ttl is None or ahora - entrada[0] < self.ttl):
+                self._datos.move_to_end((version, clave))
+                self.aciertos += 1
+                return entrada[1]
+            self.fallos += 1
+
+        # Se calcula fuera del lock para no serializar las consultas
+        valor = calcular()
+
+        with self._lock:
+            if version == self.version:
+                self._datos[(version, clave)] = (ahora, valor)
+                self._datos.move_to_end((version, clave))
+                while len(self._datos) > self.max_entradas:
+                    self._datos.popitem(last=False)
+                    self.expulsiones += 1
+        return valor
+
+    def invalidar(self):
+        with self._lock:
+            self.version += 1
+            self._datos.clear()
+
+    def estadisticas(self):
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                'entradas': len(self._datos),
+                'max_entradas': self.max_entradas,
+                'ttl': self.ttl,
+                'version': self.version,
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'expulsiones': self.expulsiones,
+                'tasa_aciertos': round(self.aciertos / consultas, 4) if consultas else None,
+            }
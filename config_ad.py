@@ -1,4 +1,6 @@
-from app import app, db, Usuario
+from app import create_app, db, Usuario
+
+app = create_app()
 
 # --- 1. CONFIGURACIÓN ---
 # Define los datos para el nuevo usuario administrador
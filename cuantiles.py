@@ -0,0 +1,111 @@
+"""Sketch KLL (Karnin, Lang y Liberty, 2016) para percentiles aproximados.
+
+Guarda como mucho unos k / (1 - c) valores (≈ 600 con k=200) sin importar
+cuántos registros tenga el usuario, y dos sketches se pueden combinar con
+merge().
+
+Cotas de error (rango normalizado, es decir, |rango_estimado - q|):
+
+- Mientras n <= k no se descarta ningún valor y los percentiles son exactos.
+- Para n > k el error de rango es ≈ 1.65 % con k=200 (99 % de confianza,
+  la misma cifra que publica Apache DataSketches para KLL con k=200). Por
+  ejemplo, la "mediana" devuelta está entre los percentiles 48.35 y 51.65.
+
+El sketch sólo admite altas; los borrados y ediciones obligan a
+reconstruirlo desde los datos originales (ver app.actualizar_cuantiles).
+"""
+import json
+import math
+import random
+from bisect import bisect_left, bisect_right
+
+K_POR_DEFECTO = 200
+ERROR_RANGO = 0.0165  # cota del error de rango con K_POR_DEFECTO (99 % de confianza)
+
+
+class SketchKLL:
+    def __init__(self, k=K_POR_DEFECTO, c=2 / 3, semilla=None):
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.compactores = [[]]
+        self._azar = random.Random(semilla)
+
+    def capacidad(self, nivel):
+        profundidad = len(self.compactores) - nivel - 1
+        return int(math.ceil(self.k * self.c ** profundidad)) + 1
+
+    def agregar(self, valor):
+        self.compactores[0].append(valor)
+        self.n += 1
+        self._comprimir()
+
+    def merge(self, otro):
+        while len(self.compactores) < len(otro.compactores):
+            self.compactores.append([])
+        for nivel, elementos in enumerate(otro.compactores):
+            self.compactores[nivel].extend(elementos)
+        self.n += otro.n
+        self._comprimir()
+
+    def _comprimir(self):
+        while sum(map(len, self.compactores)) >= sum(map(self.capacidad, range(len(self.compactores)))):
+            for nivel, elementos in enumerate(self.compactores):
+                if len(elementos) < self.capacidad(nivel):
+                    continue
+                if nivel + 1 == len(self.compactores):
+                    self.compactores.append([])
+                # Se ordena y se promueve uno de cada dos valores (con
+                # desplazamiento aleatorio) al nivel siguiente, que pesa el doble.
+                elementos.sort()
+                sobrante = [elementos.pop()] if len(elementos) % 2 else []
+                desplazamiento = self._azar.randint(0, 1)
+                self.compactores[nivel + 1].extend(elementos[desplazamiento::2])
+                self.compactores[nivel] = sobrante
+                break
+
+    def _ponderados(self):
+        pares = [(valor, 2 ** nivel) for nivel, elementos in enumerate(self.compactores) for valor in elementos]
+        pares.sort()
+        return pares
+
+    def cuantil(self, q):
+        """Valor aproximado del cuantil q (0 <= q <= 1); None si está vacío."""
+        pares = self._ponderados()
+        if not pares:
+            return None
+        total = sum(peso for _, peso in pares)
+        objetivo = q * total
+        acumulado = 0
+        for valor, peso in pares:
+            acumulado += peso
+            if acumulado >= objetivo:
+                return valor
+        return pares[-1][0]
+
+    def cuantiles(self, qs):
+        return {q: self.cuantil(q) for q in qs}
+
+    def to_json(self):
+        return json.dumps({'k': self.k, 'c': self.c, 'n': self.n, 'compactores': self.compactores})
+
+    @classmethod
+    def from_json(cls, datos):
+        d = json.loads(datos)
+        sketch = cls(k=d['k'], c=d['c'])
+        sketch.n = d['n']
+        sketch.compactores = d['compactores']
+        return sketch
+
+
+def error_de_rango(valores_ordenados, estimado, q):
+    """Distancia entre q y el rango normalizado exacto de 'estimado'.
+
+    Con valores repetidos el rango es un intervalo; si q cae dentro el error es 0.
+    """
+    n = len(valores_ordenados)
+    inferior = bisect_left(valores_ordenados, estimado) / n
+    superior = bisect_right(valores_ordenados, estimado) / n
+    if inferior <= q <= superior:
+        return 0.0
+    return min(abs(q - inferior), abs(q - superior))
@@ -0,0 +1,24 @@
+"""Configuración de gunicorn a partir del perfil de config.py (APP_PERFIL)."""
+import os
+
+from config import PERFILES
+
+_perfil = PERFILES[os.environ.get('APP_PERFIL', 'produccion')]
+
+bind = os.environ.get('WEB_BIND', '0.0.0.0:5000')
+worker_class = 'gthread'
+workers = _perfil.WORKERS
+threads = _perfil.THREADS
+preload_app = _perfil.PRELOAD
+timeout = int(os.environ.get('WEB_TIMEOUT', 30))
+forwarded_allow_ips = '*'
+accesslog = '-'
+
+
+def post_fork(server, worker):
+    # Con preload_app el proceso maestro importó la aplicación; las
+    # conexiones que haya abierto no deben compartirse entre workers.
+    from app import db
+    from wsgi import app
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,137 @@
+"""Procesamiento de las imágenes subidas para los consejos.
+
+guardar_imagen() copia el archivo subido a disco por bloques (cortando si
+supera el tamaño máximo), lo nombra por el hash de su contenido y genera las
+variantes redimensionadas:
+
+    <hash>-<ancho>.webp            (para navegadores con WebP)
+    <hash>-<ancho>.jpg | .png      (respaldo; PNG sólo si hay transparencia)
+
+con un ancho por cada tamaño de VARIANTES, sin ampliar nunca la imagen: si el
+original es más estrecho, varias variantes coinciden y se guarda un solo
+archivo. Subir dos veces la misma imagen reutiliza los archivos existentes.
+
+El archivo de respaldo más grande identifica la imagen (es lo que se guarda en
+Consejo.imagen_url); a partir de su nombre variantes() reconstruye el resto
+sin tocar el disco.
+"""
+import glob
+import hashlib
+import os
+import re
+import tempfile
+
+from PIL import Image, ImageOps
+
+VARIANTES = {'miniatura': 160, 'tarjeta': 480, 'completa': 1200}
+MAX_BYTES = 8 * 1024 * 1024
+FORMATOS_PERMITIDOS = {'JPEG', 'PNG', 'GIF', 'WEBP'}
+CALIDAD_WEBP = 80
+CALIDAD_JPEG = 85
+LONGITUD_HASH = 20
+BLOQUE = 64 * 1024
+
+_NOMBRE = re.compile(rf'^([0-9a-f]{{{LONGITUD_HASH}}})-(\d+)\.(jpg|png)$')
+
+
+class ImagenInvalida(ValueError):
+    pass
+
+
+def anchos_de(ancho_original):
+    """Anchos distintos a generar, de menor a mayor."""
+    return sorted({min(ancho, ancho_original) for ancho in VARIANTES.values()})
+
+
+def _copiar_con_limite(origen, destino, max_bytes):
+    """Copia por bloques calculando el SHA-256; falla si se supera max_bytes."""
+    resumen = hashlib.sha256()
+    total = 0
+    while True:
+        bloque = origen.read(BLOQUE)
+        if not bloque:
+            break
+        total += len(bloque)
+        if total > max_bytes:
+            raise ImagenInvalida(f'la imagen supera el máximo de {max_bytes // (1024 * 1024)} MB.')
+        resumen.update(bloque)
+        destino.write(bloque)
+    if total == 0:
+        raise ImagenInvalida('el archivo está vacío.')
+    return resumen.hexdigest()[:LONGITUD_HASH]
+
+
+def _existente(carpeta, clave):
+    """Nombre del respaldo más grande ya generado para 'clave', o None."""
+    nombres = [os.path.basename(ruta) for ruta in glob.glob(os.path.join(carpeta, f'{clave}-*'))]
+    respaldos = [(int(m.group(2)), nombre) for nombre in nombres if (m := _NOMBRE.match(nombre))]
+    return max(respaldos)[1] if respaldos else None
+
+
+def _generar_variantes(ruta_original, carpeta, clave):
+    try:
+        with Image.open(ruta_original) as imagen:
+            if imagen.format not in FORMATOS_PERMITIDOS:
+                raise ImagenInvalida(f'formato no admitido ({imagen.format}).')
+            imagen = ImageOps.exif_transpose(imagen)  # respeta la orientación de la cámara
+            imagen.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ImagenInvalida('el archivo no es una imagen válida.') from e
+
+    transparente = imagen.mode in ('RGBA', 'LA', 'PA') or 'transparency' in imagen.info
+    imagen = imagen.convert('RGBA' if transparente else 'RGB')
+    extension = 'png' if transparente else 'jpg'
+
+    nombre = None
+    for ancho in anchos_de(imagen.width):
+        alto = max(1, round(imagen.height * ancho / imagen.width))
+        variante = imagen if ancho == imagen.width else imagen.resize((ancho, alto), Image.LANCZOS)
+        base = os.path.join(carpeta, f'{clave}-{ancho}')
+        variante.save(f'{base}.webp', 'WEBP', quality=CALIDAD_WEBP, method=4)
+        if transparente:
+            variante.save(f'{base}.png', 'PNG', optimize=True)
+        else:
+            variante.save(f'{base}.jpg', 'JPEG', quality=CALIDAD_JPEG, optimize=True, progressive=True)
+        nombre = f'{clave}-{ancho}.{extension}'
+    return nombre
+
+
+def guardar_imagen(archivo, carpeta, max_bytes=MAX_BYTES):
+    """Guarda el archivo subido (FileStorage) y devuelve el nombre del respaldo más grande.
+
+    Lanza ImagenInvalida si es demasiado grande o no es una imagen admitida.
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, ruta_temporal = tempfile.mkstemp(dir=carpeta, suffix='.subida')
+    try:
+        with os.fdopen(descriptor, 'wb') as destino:
+            clave = _copiar_con_limite(archivo.stream, destino, max_bytes)
+        return _existente(carpeta, clave) or _generar_variantes(ruta_temporal, carpeta, clave)
+    finally:
+        os.remove(ruta_temporal)
+
+
+def variantes(nombre):
+    """Para un nombre devuelto por guardar_imagen: {'webp': [(archivo, ancho)], 'respaldo': [...]}.
+
+    Devuelve None si el nombre no sigue el esquema (imágenes subidas antes).
+    """
+    coincidencia = _NOMBRE.match(nombre)
+    if not coincidencia:
+        return None
+    clave, ancho_mayor, extension = coincidencia.group(1), int(coincidencia.group(2)), coincidencia.group(3)
+    anchos = anchos_de(ancho_mayor)
+    return {
+        'webp': [(f'{clave}-{ancho}.webp', ancho) for ancho in anchos],
+        'respaldo': [(f'{clave}-{ancho}.{extension}', ancho) for ancho in anchos],
+    }
+
+
+def eliminar_imagen(carpeta, nombre):
+    """Borra el archivo y, si es del esquema con hash, todas sus variantes."""
+    grupos = variantes(nombre)
+    nombres = [archivo for lista in grupos.values() for archivo, _ in lista] if grupos else [nombre]
+    for archivo in nombres:
+        ruta = os.path.join(carpeta, archivo)
+        if os.path.exists(ruta):
+            os.remove(ruta)
@@ -0,0 +1,80 @@
+"""Métricas por ruta (latencia, consultas SQL y tiempo SQL) en formato Prometheus.
+
+Cada proceso lleva sus propios contadores: con varios workers de gunicorn
+cada raspado de /admin/metrics devuelve los del worker que lo atiende.
+"""
+import threading
+from bisect import bisect_left
+
+BUCKETS_DURACION = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_CONSULTAS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class Histograma:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.conteos = [0] * (len(buckets) + 1)  # el último es +Inf
+        self.suma = 0.0
+        self.total = 0
+
+    def observar(self, valor):
+        self.conteos[bisect_left(self.buckets, valor)] += 1
+        self.suma += valor
+        self.total += 1
+
+    def lineas(self, nombre, etiquetas):
+        acumulado = 0
+        for limite, conteo in zip(self.buckets + ('+Inf',), self.conteos):
+            acumulado += conteo
+            yield f'{nombre}_bucket{{{etiquetas},le="{limite}"}} {acumulado}'
+        yield f'{nombre}_sum{{{etiquetas}}} {self.suma:.6f}'
+        yield f'{nombre}_count{{{etiquetas}}} {self.total}'
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricasPeticiones:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._duracion = {}
+        self._consultas = {}
+        self._sql_segundos = {}
+
+    def registrar(self, endpoint, metodo, estado, duracion, consultas, sql_segundos):
+        clave = (endpoint, metodo, str(estado))
+        with self._lock:
+            if clave not in self._duracion:
+                self._duracion[clave] = Histograma(BUCKETS_DURACION)
+                self._consultas[clave] = Histograma(BUCKETS_CONSULTAS)
+                self._sql_segundos[clave] = 0.0
+            self._duracion[clave].observar(duracion)
+            self._consultas[clave].observar(consultas)
+            self._sql_segundos[clave] += sql_segundos
+
+    def prometheus(self, extra=()):
+        """Texto de exposición de Prometheus; 'extra' son (nombre, tipo, ayuda, valor) adicionales."""
+        lineas = []
+        with self._lock:
+            claves = sorted(self._duracion)
+            etiquetas = {c: 'endpoint="{}",metodo="{}",estado="{}"'.format(*map(_escapar, c)) for c in claves}
+
+            lineas += ['# HELP peticion_duracion_segundos Duración de la petición por endpoint.',
+                       '# TYPE peticion_duracion_segundos histogram']
+            for clave in claves:
+                lineas += self._duracion[clave].lineas('peticion_duracion_segundos', etiquetas[clave])
+
+            lineas += ['# HELP peticion_consultas_sql Sentencias SQL ejecutadas por petición.',
+                       '# TYPE peticion_consultas_sql histogram']
+            for clave in claves:
+                lineas += self._consultas[clave].lineas('peticion_consultas_sql', etiquetas[clave])
+
+            lineas += ['# HELP peticion_sql_segundos_total Tiempo total dentro de la base de datos.',
+                       '# TYPE peticion_sql_segundos_total counter']
+            for clave in claves:
+                lineas.append(f'peticion_sql_segundos_total{{{etiquetas[clave]}}} {self._sql_segundos[clave]:.6f}')
+
+        for nombre, tipo, ayuda, valor in extra:
+            lineas += [f'# HELP {nombre} {ayuda}', f'# TYPE {nombre} {tipo}', f'{nombre} {valor}']
+        return '\n'.join(lineas) + '\n'
@@ -0,0 +1,83 @@
+"""Indicadores de series temporales con NumPy (ver app.indicadores_de_tendencia).
+
+Una serie son dos arrays contiguos float64: 'tiempos' (segundos desde
+1970, ascendentes) y 'valores' con forma (n, k), una columna por campo
+(k = 2 para la presión arterial). Cada indicador se calcula para todas las
+columnas a la vez con operaciones vectorizadas, sin bucles en Python:
+
+- promedio y desviación estándar muestral,
+- pendiente de la recta de mínimos cuadrados (unidades por día) y su R²,
+- media móvil de las últimas 'ventana' lecturas,
+- cambio entre la media de los últimos 'dias_cambio' días y la de los
+  'dias_cambio' días anteriores (NaN si alguno de los dos tramos está vacío).
+"""
+import numpy as np
+
+SEGUNDOS_DIA = 86400.0
+
+
+def agrupar_filas(filas, columnas):
+    """{codigo: (tiempos, valores)} a partir de filas (codigo, t, v1, ..., vk) de un cursor.
+
+    Las filas llegan ordenadas por (codigo, t) y son las tuplas del driver
+    (cursor.fetchall()): np.array las copia en un único bloque float64 en C
+    y después se corta por los cambios de código, sin recorrerlas en Python.
+    Ninguna columna puede ser NULL.
+    """
+    matriz = np.array(filas, dtype=np.float64).reshape(-1, columnas + 2)
+    cortes = np.flatnonzero(np.diff(matriz[:, 0])) + 1
+    return {
+        int(bloque[0, 0]): (np.ascontiguousarray(bloque[:, 1]), np.ascontiguousarray(bloque[:, 2:]))
+        for bloque in np.split(matriz, cortes) if len(bloque)
+    }
+
+
+def media_movil(valores, ventana):
+    """Media de cada tramo de 'ventana' lecturas consecutivas, con sumas acumuladas."""
+    acumulado = np.cumsum(valores, axis=0)
+    acumulado = np.vstack([np.zeros((1, valores.shape[1])), acumulado])
+    return (acumulado[ventana:] - acumulado[:-ventana]) / ventana
+
+
+def indicadores(tiempos, valores, ventana=7, dias_cambio=30):
+    """{indicador: array de k valores} de una serie; None si está vacía."""
+    n = len(tiempos)
+    if n == 0:
+        return None
+    dias = (tiempos - tiempos[0]) / SEGUNDOS_DIA
+    promedio = valores.mean(axis=0)
+    centrados = valores - promedio
+    suma_cuadrados = np.einsum('ij,ij->j', centrados, centrados)
+    desviacion = np.sqrt(suma_cuadrados / (n - 1)) if n > 1 else np.zeros_like(promedio)
+
+    # Mínimos cuadrados con x = días: pendiente = Σ dx·dy / Σ dx²
+    dx = dias - dias.mean()
+    sxx = dx @ dx
+    if sxx > 0:
+        pendiente = dx @ centrados / sxx
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r2 = np.where(suma_cuadrados > 0, pendiente ** 2 * sxx / suma_cuadrados, 0.0)
+    else:
+        pendiente = r2 = np.zeros_like(promedio)
+
+    movil = media_movil(valores, min(ventana, n))[-1]
+
+    fin = tiempos[-1]
+    limite = fin - dias_cambio * SEGUNDOS_DIA
+    reciente = tiempos > limite
+    anterior = (tiempos > limite - dias_cambio * SEGUNDOS_DIA) & ~reciente
+    if reciente.any() and anterior.any():
+        cambio = valores[reciente].mean(axis=0) - valores[anterior].mean(axis=0)
+    else:
+        cambio = np.full_like(promedio, np.nan)
+
+    return {
+        'conteo': n,
+        'dias': float(dias[-1]),
+        'promedio': promedio,
+        'desviacion': desviacion,
+        'pendiente_dia': pendiente,
+        'r2': r2,
+        'media_movil': movil,
+        'cambio_periodo': cambio,
+    }
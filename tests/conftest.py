@@ -0,0 +1,137 @@
+"""Fixtures comunes: la aplicación con el perfil 'pruebas' (SQLite en memoria)
+y un contador de sentencias SQL.
+
+    pip install pytest
+    python -m pytest -q
+"""
+import os
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as aplicacion  # noqa: E402
+from app import create_app, db, Usuario, Consejo, METRIC_MODELS, PresionArterial, registrar_lote_metrica  # noqa: E402
+
+# Repeticiones de una misma sentencia (con distintos parámetros) a partir de
+# las cuales se considera un N+1.
+UMBRAL_N_MAS_1 = 3
+
+
+@pytest.fixture(scope='session')
+def app():
+    return create_app('pruebas')
+
+
+@pytest.fixture(autouse=True)
+def base_limpia(app):
+    with app.app_context():
+        for tabla in reversed(db.metadata.sorted_tables):
+            db.session.execute(tabla.delete())
+        if aplicacion.consejos_fts_disponible():
+            db.session.execute(db.text("DELETE FROM consejo_fts"))
+        db.session.commit()
+    app.extensions['cache_consejos'].invalidar()
+    yield
+
+
+class RegistroConsultas:
+    def __init__(self):
+        self.sentencias = []
+
+    def __len__(self):
+        return len(self.sentencias)
+
+    def repetidas(self, umbral=UMBRAL_N_MAS_1):
+        """Sentencias ejecutadas 'umbral' o más veces: el patrón N+1."""
+        normalizadas = Counter(re.sub(r'\s+', ' ', sentencia).strip() for sentencia in self.sentencias)
+        return {sentencia: veces for sentencia, veces in normalizadas.items() if veces >= umbral}
+
+    def resumen(self):
+        return '\n'.join(f'  {i + 1:>3}. {s[:200]}' for i, s in enumerate(self.sentencias))
+
+
+@pytest.fixture
+def contar_consultas(app):
+    """Context manager que registra las sentencias SQL ejecutadas dentro del bloque."""
+    @contextmanager
+    def contar():
+        registro = RegistroConsultas()
+
+        def al_ejecutar(conexion, cursor, sentencia, parametros, contexto, executemany):
+            registro.sentencias.append(sentencia)
+
+        with app.app_context():
+            motor = db.engine
+        event.listen(motor, 'before_cursor_execute', al_ejecutar)
+        try:
+            yield registro
+        finally:
+            event.remove(motor, 'before_cursor_execute', al_ejecutar)
+    return contar
+
+
+def crear_usuario(nombre, rol='user', password='clave'):
+    usuario = Usuario(nombre=nombre, email=f'{nombre}@prueba', edad=40, sexo='femenino', rol=rol)
+    usuario.set_password(password)
+    db.session.add(usuario)
+    db.session.flush()
+    return usuario
+
+
+def crear_mediciones(usuario, por_metrica=5):
+    """'por_metrica' lecturas de cada métrica, con las tablas derivadas al día."""
+    inicio = datetime(2024, 1, 1)
+    valores = {'peso': 60, 'altura': 160, 'ritmo_cardiaco': 70, 'nivel_azucar': 90,
+               'colesterol': 180, 'oxigeno_sangre': 95}
+    for nombre, Modelo in METRIC_MODELS.items():
+        if Modelo is PresionArterial:
+            filas = [{'usuario_id': usuario.id, 'sistolica': 110 + i, 'diastolica': 70 + i,
+                      'fecha': inicio + timedelta(days=i)} for i in range(por_metrica)]
+        else:
+            filas = [{'usuario_id': usuario.id, 'valor': valores[nombre] + i,
+                      'fecha': inicio + timedelta(days=i)} for i in range(por_metrica)]
+        db.session.execute(db.insert(Modelo), filas)
+        registrar_lote_metrica(nombre, usuario.id, filas)
+
+
+@pytest.fixture
+def datos(app):
+    """Un paciente con mediciones, un administrador, más pacientes y consejos."""
+    with app.app_context():
+        paciente = crear_usuario('paciente')
+        crear_mediciones(paciente)
+        admin = crear_usuario('admin', rol='admin')
+        for i in range(10):
+            crear_mediciones(crear_usuario(f'otro{i}'), por_metrica=2)
+        for i in range(6):
+            consejo = Consejo(titulo=f'Consejo {i}', contenido=f'Contenido de nutrición {i}',
+                              tema='Nutrición' if i % 2 else 'Sueño', usuario_admin_id=admin.id)
+            db.session.add(consejo)
+            aplicacion.indexar_consejo(consejo)
+        db.session.commit()
+        return {'paciente': paciente.id, 'admin': admin.id,
+                'consejo': Consejo.query.first().id}
+
+
+def iniciar_sesion(app, nombre):
+    cliente = app.test_client()
+    respuesta = cliente.post('/login', data={'nameUser': nombre, 'passwordUser': 'clave'})
+    assert respuesta.status_code == 302, respuesta.data
+    return cliente
+
+
+@pytest.fixture
+def cliente_paciente(app, datos):
+    return iniciar_sesion(app, 'paciente')
+
+
+@pytest.fixture
+def cliente_admin(app, datos):
+    return iniciar_sesion(app, 'admin')
@@ -0,0 +1,128 @@
+"""Almacén unificado ('medicion'): mismos resultados que las siete tablas y menos consultas."""
+import time
+from datetime import datetime
+
+import pytest
+
+from app import METRIC_MODELS, Medicion, RepositorioMediciones, RepositorioPorTabla, RepositorioUnificado, db
+
+
+@pytest.fixture
+def unificado(app, datos, monkeypatch):
+    monkeypatch.setitem(app.config, 'ALMACEN_MEDICIONES', 'unificado')
+    resultado = app.test_cli_runner().invoke(args=['migrar-mediciones'])
+    assert resultado.exit_code == 0, resultado.output
+    return datos
+
+
+def como_tuplas(registros):
+    return [(r.id, r.fecha, getattr(r, 'valor', None), getattr(r, 'sistolica', None), getattr(r, 'diastolica', None))
+            for r in registros]
+
+
+def test_migracion_copia_todo(app, unificado):
+    with app.app_context():
+        origen = sum(Modelo.query.count() for Modelo in METRIC_MODELS.values())
+        assert Medicion.query.count() == origen
+
+
+def test_mismos_resultados_que_las_tablas(app, unificado):
+    tablas, medicion = RepositorioPorTabla(), RepositorioUnificado()
+    paciente = unificado['paciente']
+    with app.app_context():
+        a, b = tablas.todas(paciente), medicion.todas(paciente)
+        assert {m: como_tuplas(r) for m, r in a.items()} == {m: como_tuplas(r) for m, r in b.items()}
+
+        cursores = {}
+        for _ in range(3):  # paginas de 2 con los cursores que devuelve la anterior
+            a = tablas.paginas(paciente, cursores, por_pagina=2)
+            b = medicion.paginas(paciente, cursores, por_pagina=2)
+            for metrica in METRIC_MODELS:
+                assert como_tuplas(a[metrica][0]) == como_tuplas(b[metrica][0])
+                assert a[metrica][1] == b[metrica][1]
+            cursores = {m: (r[-1].fecha, r[-1].id) for m, (r, _) in b.items() if r}
+
+        desde, hasta = datetime(2024, 1, 2), datetime(2024, 1, 4)
+        a = tablas.paginas(paciente, {}, desde=desde, hasta=hasta)
+        b = medicion.paginas(paciente, {}, desde=desde, hasta=hasta)
+        assert {m: como_tuplas(r) for m, (r, _) in a.items()} == {m: como_tuplas(r) for m, (r, _) in b.items()}
+
+        ids = [unificado['paciente'], unificado['admin']]
+        assert tablas.actividad(ids) == medicion.actividad(ids)
+
+
+def test_escrituras_se_sincronizan(app, unificado, cliente_paciente, cliente_admin):
+    cliente_paciente.post('/agregar/peso', data={'valor': '80'})
+    with app.app_context():
+        nuevo = Medicion.query.filter_by(usuario_id=unificado['paciente'], tipo='peso', v1=80).one()
+        registro_id = nuevo.id
+
+    cliente_admin.post(f'/admin/editar/registro/peso/{registro_id}', data={'valor': '81'})
+    with app.app_context():
+        assert db.session.get(METRIC_MODELS['peso'], registro_id).valor == 81
+        assert Medicion.query.filter_by(tipo='peso', id=registro_id).one().v1 == 81
+
+    cliente_admin.post(f'/admin/eliminar/registro/peso/{registro_id}')
+    with app.app_context():
+        assert Medicion.query.filter_by(tipo='peso', id=registro_id).count() == 0
+
+
+def test_doble_escritura_antes_de_migrar(app, datos, cliente_paciente, monkeypatch):
+    # Se sigue leyendo de las tablas, pero las altas ya llegan a 'medicion'
+    monkeypatch.setitem(app.config, 'MEDICIONES_DOBLE_ESCRITURA', True)
+    cliente_paciente.post('/agregar/peso', data={'valor': '82'})
+    with app.app_context():
+        assert Medicion.query.filter_by(usuario_id=datos['paciente'], tipo='peso', v1=82).count() == 1
+        assert Medicion.query.filter(Medicion.v1 != 82).count() == 0  # lo anterior lo copia migrar-mediciones
+
+
+@pytest.fixture
+def zona_con_horario_de_verano(monkeypatch):
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_orden_de_paginas_independiente_de_la_zona(app, unificado, zona_con_horario_de_verano):
+    # 02:30 del 10/03/2024 no existe en Nueva York: como hora local caería después de las 03:10
+    paciente = unificado['paciente']
+    with app.app_context():
+        Modelo = METRIC_MODELS['peso']
+        for fecha in (datetime(2024, 3, 10, 2, 30), datetime(2024, 3, 10, 3, 10)):
+            registro = Modelo(usuario_id=paciente, valor=75, fecha=fecha)
+            db.session.add(registro)
+            db.session.flush()
+            db.session.add(Medicion(usuario_id=paciente, fecha=fecha, tipo='peso', id=registro.id, v1=75))
+        db.session.commit()
+        registros, _ = RepositorioUnificado().paginas(paciente, {}, por_pagina=2)['peso']
+    assert [r.fecha.hour for r in registros] == [3, 2]
+
+
+@pytest.mark.parametrize('url, presupuesto', [
+    ('/historial', 1),  # un UNION ALL sobre 'medicion'
+    ('/admin/registros/{paciente}', 2),  # usuario + un recorrido de la clave primaria
+    ('/admin/dashboard', 2),
+])
+def test_presupuesto_unificado(request, unificado, contar_consultas, url, presupuesto):
+    cliente = request.getfixturevalue('cliente_admin' if url.startswith('/admin') else 'cliente_paciente')
+    with contar_consultas() as consultas:
+        respuesta = cliente.get(url.format(**unificado))
+    assert respuesta.status_code == 200
+    assert len(consultas) <= presupuesto, consultas.resumen()
+
+
+def test_repositorio_incompleto_falla_al_instanciarse():
+    class SinSeries(RepositorioMediciones):
+        def paginas(self, usuario_id, cursores, desde=None, hasta=None, por_pagina=20):
+            return {}
+
+        def todas(self, usuario_id):
+            return {}
+
+        def actividad(self, usuario_ids):
+            return {}
+
+    with pytest.raises(TypeError, match='consulta_series'):
+        SinSeries()
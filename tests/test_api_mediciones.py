@@ -0,0 +1,62 @@
+"""API de lotes: errores por medición y fechas con zona horaria."""
+from datetime import datetime
+
+import app as aplicacion
+from app import METRIC_MODELS, Peso
+
+
+def enviar(cliente, mediciones):
+    # NaN e Infinity no son JSON estándar, pero json.loads de Flask los acepta
+    return cliente.post('/api/v1/mediciones/lote', data=mediciones, content_type='application/json')
+
+
+def test_no_finitos_se_rechazan_por_elemento(app, cliente_paciente):
+    respuesta = enviar(cliente_paciente, '[{"metrica": "peso", "valor": NaN},'
+                                         ' {"metrica": "peso", "valor": Infinity},'
+                                         ' {"metrica": "ritmo_cardiaco", "valor": -Infinity},'
+                                         ' {"metrica": "peso", "valor": 71}]')
+    assert respuesta.status_code == 201
+    assert respuesta.json['insertados'] == 1
+    assert [e['indice'] for e in respuesta.json['errores']] == [0, 1, 2]
+
+
+def test_enteros_sin_decimales_ni_booleanos(app, datos, cliente_paciente):
+    respuesta = enviar(cliente_paciente, '[{"metrica": "ritmo_cardiaco", "valor": 150.9},'
+                                         ' {"metrica": "ritmo_cardiaco", "valor": "150.9"},'
+                                         ' {"metrica": "ritmo_cardiaco", "valor": true},'
+                                         ' {"metrica": "peso", "valor": false},'
+                                         ' {"metrica": "ritmo_cardiaco", "valor": 151.0}]')
+    assert respuesta.status_code == 201
+    assert respuesta.json['insertados'] == 1
+    assert [e['indice'] for e in respuesta.json['errores']] == [0, 1, 2, 3]
+    assert all('no es un valor numérico válido' in e['error'] for e in respuesta.json['errores'])
+    with app.app_context():
+        Modelo = METRIC_MODELS['ritmo_cardiaco']
+        guardados = Modelo.query.filter(Modelo.usuario_id == datos['paciente'], Modelo.valor >= 150)
+        assert [r.valor for r in guardados] == [151]
+
+
+def test_fecha_con_zona_se_guarda_en_utc(app, datos, cliente_paciente):
+    respuesta = enviar(cliente_paciente, '[{"metrica": "peso", "valor": 72, "fecha": "2024-05-01T08:30:00+02:00"}]')
+    assert respuesta.status_code == 201
+    with app.app_context():
+        assert Peso.query.filter_by(usuario_id=datos['paciente'], valor=72).one().fecha == datetime(2024, 5, 1, 6, 30)
+
+
+def test_fallo_de_la_base_de_datos_por_elemento(app, datos, cliente_paciente, monkeypatch):
+    validar = aplicacion.validar_valor_individual
+
+    def sin_validar_999(campo, valor):
+        # 999 llega a la base de datos como NULL y viola NOT NULL
+        return (None, None) if valor == 999 else validar(campo, valor)
+    monkeypatch.setattr(aplicacion, 'validar_valor_individual', sin_validar_999)
+
+    respuesta = enviar(cliente_paciente, '[{"metrica": "peso", "valor": 73}, {"metrica": "peso", "valor": 999},'
+                                         ' {"metrica": "peso", "valor": 74}]')
+    assert respuesta.status_code == 201
+    assert respuesta.json['insertados'] == 2
+    assert respuesta.json['errores'] == [{'indice': 1, 'error': 'No se pudo guardar la medición.'}]
+    assert 'NOT NULL' not in respuesta.get_data(as_text=True)
+    with app.app_context():
+        Modelo = METRIC_MODELS['peso']
+        assert Modelo.query.filter(Modelo.usuario_id == datos['paciente'], Modelo.valor.in_([73, 74])).count() == 2
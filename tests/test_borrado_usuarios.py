@@ -0,0 +1,77 @@
+"""Borrado de usuarios: marca inmediata, borrado por lotes y ON DELETE CASCADE."""
+from app import (METRIC_MODELS, BorradoUsuario, Consejo, EstadisticaMetrica, RollupMetrica, Usuario,
+                 UsuarioTrigrama, borrar_usuario_por_lotes, db)
+from conftest import crear_mediciones, crear_usuario
+
+
+def registros_de(usuario_id):
+    return sum(Modelo.query.filter_by(usuario_id=usuario_id).count() for Modelo in METRIC_MODELS.values())
+
+
+def test_eliminar_usuario_borra_todo(app, datos, cliente_admin):
+    respuesta = cliente_admin.post(f"/admin/eliminar/usuario/{datos['paciente']}")
+    assert respuesta.status_code == 302
+    with app.app_context():
+        assert db.session.get(Usuario, datos['paciente']) is None
+        assert registros_de(datos['paciente']) == 0
+        for Modelo in (EstadisticaMetrica, RollupMetrica, UsuarioTrigrama, BorradoUsuario):
+            assert Modelo.query.filter_by(usuario_id=datos['paciente']).count() == 0
+    assert cliente_admin.get('/admin/borrados', query_string={'usuario_id': datos['paciente']}).json == {
+        'usuario_id': datos['paciente'], 'estado': 'completado'}
+
+
+def test_historial_grande_queda_marcado_y_oculto(app, datos, cliente_admin, monkeypatch):
+    programados = []
+    monkeypatch.setattr('app.programar_borrado', programados.append)
+    monkeypatch.setitem(app.config, 'BORRADO_EN_LINEA', 10)
+
+    cliente_admin.post(f"/admin/eliminar/usuario/{datos['paciente']}")
+
+    assert programados == [datos['paciente']]
+    progreso = cliente_admin.get('/admin/borrados', query_string={'usuario_id': datos['paciente']}).json
+    assert progreso['estado'] == 'pendiente' and progreso['total'] == 35 and progreso['borrados'] == 0
+    assert b'paciente@prueba' not in cliente_admin.get('/admin/dashboard').data
+    assert cliente_admin.get(f"/admin/registros/{datos['paciente']}").status_code == 404
+    respuesta = app.test_client().post('/login', data={'nameUser': 'paciente', 'passwordUser': 'clave'})
+    assert respuesta.status_code == 200  # no inicia sesión
+
+
+def test_borrado_por_lotes_informa_progreso(app, datos):
+    lotes = []
+    with app.app_context():
+        db.session.add(BorradoUsuario(usuario_id=datos['paciente'], total=35))
+        db.session.commit()
+
+        def al_borrar(conexion, cursor, sentencia, *args):
+            if sentencia.startswith('UPDATE borrado_usuario SET borrados'):
+                lotes.append(sentencia)
+        db.event.listen(db.engine, 'before_cursor_execute', al_borrar)
+        try:
+            borrar_usuario_por_lotes(datos['paciente'], lote=2)
+        finally:
+            db.event.remove(db.engine, 'before_cursor_execute', al_borrar)
+
+        assert len(lotes) == 7 * 3  # 5 lecturas por métrica en lotes de 2
+        assert db.session.get(Usuario, datos['paciente']) is None
+        assert registros_de(datos['paciente']) == 0
+
+
+def test_borrar_admin_conserva_sus_consejos(app, datos):
+    with app.app_context():
+        db.session.add(BorradoUsuario(usuario_id=datos['admin']))
+        db.session.commit()
+        borrar_usuario_por_lotes(datos['admin'])
+        assert Consejo.query.count() == 6
+        assert Consejo.query.filter(Consejo.usuario_admin_id.isnot(None)).count() == 0
+
+
+def test_on_delete_cascade(app):
+    with app.app_context():
+        usuario = crear_usuario('cascada')
+        usuario_id = usuario.id
+        crear_mediciones(usuario, por_metrica=3)
+        db.session.commit()
+        db.session.execute(db.delete(Usuario.__table__).where(Usuario.id == usuario_id))
+        db.session.commit()
+        assert registros_de(usuario_id) == 0
+        assert EstadisticaMetrica.query.filter_by(usuario_id=usuario_id).count() == 0
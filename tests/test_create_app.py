@@ -0,0 +1,51 @@
+"""create_app(): cada llamada crea una aplicación independiente."""
+import os
+
+from flask.cli import ScriptInfo
+
+import config
+from app import Usuario, create_app, db
+from conftest import crear_usuario, iniciar_sesion
+
+
+def test_aplicaciones_aisladas(app):
+    otra = create_app('pruebas')
+    assert otra is not app
+    with otra.app_context():
+        crear_usuario('solo_en_otra')
+        db.session.commit()
+        assert Usuario.query.filter_by(nombre='solo_en_otra').count() == 1
+    with app.app_context():
+        assert Usuario.query.filter_by(nombre='solo_en_otra').count() == 0
+
+
+def test_flask_app_app_usa_la_fabrica(monkeypatch):
+    # 'flask --app app <comando>' no encuentra un objeto 'app' en el módulo y llama a create_app()
+    monkeypatch.setenv('APP_PERFIL', 'pruebas')
+    aplicacion = ScriptInfo(app_import_path='app').load_app()
+    assert aplicacion.config['PERFIL'] == 'pruebas'
+    assert 'reconstruir-ultimo-registro' in aplicacion.cli.list_commands(None)
+    assert aplicacion.url_map.bind('').match('/login')[0] == 'principal.login'
+
+
+def test_carpeta_de_subidas(tmp_path, monkeypatch):
+    # Relativa a la aplicación aunque el proceso arranque en otro directorio
+    monkeypatch.chdir(tmp_path)
+    assert create_app('pruebas').config['UPLOAD_FOLDER'] == os.path.join(
+        os.path.dirname(os.path.abspath(config.__file__)), 'static', 'uploads', 'consejos')
+    assert not (tmp_path / 'static').exists()
+
+    monkeypatch.setattr(config.Pruebas, 'UPLOAD_FOLDER', str(tmp_path / 'subidas'))
+    assert create_app('pruebas').config['UPLOAD_FOLDER'] == str(tmp_path / 'subidas')
+    assert (tmp_path / 'subidas').is_dir()
+
+
+def test_cache_de_consejos_por_aplicacion(app, cliente_paciente):
+    assert 'Consejo 0' in cliente_paciente.get('/consejos').get_data(as_text=True)
+    otra = create_app('pruebas')
+    assert otra.extensions['cache_consejos'] is not app.extensions['cache_consejos']
+    with otra.app_context():
+        crear_usuario('paciente')
+        db.session.commit()
+    html = iniciar_sesion(otra, 'paciente').get('/consejos').get_data(as_text=True)
+    assert 'Consejo 0' not in html
@@ -0,0 +1,76 @@
+"""SketchKLL frente a los cuantiles exactos: cota ERROR_RANGO, merge y JSON."""
+import random
+
+import pytest
+
+from cuantiles import ERROR_RANGO, K_POR_DEFECTO, SketchKLL, error_de_rango
+
+QS = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+
+
+def flujo(tipo, n, semilla):
+    azar = random.Random(semilla)
+    if tipo == 'uniforme':
+        return [azar.uniform(50, 600) for _ in range(n)]
+    if tipo == 'normal':
+        return [azar.gauss(120, 15) for _ in range(n)]
+    if tipo == 'ordenado':
+        return sorted(azar.uniform(0, 1) for _ in range(n))
+    if tipo == 'inverso':
+        return sorted((azar.uniform(0, 1) for _ in range(n)), reverse=True)
+    return [azar.randint(60, 100) for _ in range(n)]  # 'repetidos': enteros con muchos empates
+
+
+def peor_error(sketch, valores):
+    exactos = sorted(valores)
+    return max(error_de_rango(exactos, sketch.cuantil(q), q) for q in QS)
+
+
+@pytest.mark.parametrize('tipo', ['uniforme', 'normal', 'ordenado', 'inverso', 'repetidos'])
+@pytest.mark.parametrize('semilla', [1, 2, 3])
+def test_error_de_rango_dentro_de_la_cota(tipo, semilla):
+    valores = flujo(tipo, 20000, semilla)
+    sketch = SketchKLL(semilla=semilla)
+    for valor in valores:
+        sketch.agregar(valor)
+    assert sketch.n == len(valores)
+    assert peor_error(sketch, valores) <= ERROR_RANGO
+
+
+def test_exacto_hasta_k():
+    valores = flujo('uniforme', K_POR_DEFECTO, 7)
+    sketch = SketchKLL(semilla=7)
+    for valor in valores:
+        sketch.agregar(valor)
+    assert peor_error(sketch, valores) == 0.0
+
+
+def test_merge_respeta_la_cota():
+    valores = flujo('normal', 30000, 11)
+    partes = [SketchKLL(semilla=i) for i in range(3)]
+    for i, valor in enumerate(valores):
+        partes[i % 3].agregar(valor)
+    combinado = partes[0]
+    combinado.merge(partes[1])
+    combinado.merge(partes[2])
+    assert combinado.n == len(valores)
+    assert peor_error(combinado, valores) <= ERROR_RANGO
+
+
+def test_json_ida_y_vuelta():
+    valores = flujo('uniforme', 5000, 5)
+    sketch = SketchKLL(semilla=5)
+    for valor in valores[:4000]:
+        sketch.agregar(valor)
+    copia = SketchKLL.from_json(sketch.to_json())
+    assert copia.n == sketch.n and copia.k == sketch.k
+    assert copia.cuantiles(QS) == sketch.cuantiles(QS)
+
+    # La copia sigue admitiendo altas y combinándose
+    for valor in valores[4000:]:
+        copia.agregar(valor)
+    assert copia.n == len(valores)
+    assert peor_error(copia, valores) <= ERROR_RANGO
+    otra = SketchKLL.from_json(SketchKLL().to_json())
+    otra.merge(copia)
+    assert otra.n == len(valores) and otra.cuantiles(QS) == copia.cuantiles(QS)
@@ -0,0 +1,58 @@
+"""Agregados de /estadisticas para usuarios con lecturas anteriores a la tabla."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import ESTADISTICAS_CAMPOS, METRIC_MODELS, EstadisticaMetrica, PresionArterial, db
+from conftest import crear_usuario, iniciar_sesion
+
+# Lecturas insertadas sin pasar por las tablas derivadas, como en una base antigua
+ANTERIORES = {
+    'ritmo_cardiaco': [60, 70, 80],
+    'peso': [70.5, 72.5],
+    'colesterol': [180, 200, 190],
+    'presion_arterial': [(110, 70), (130, 90)],
+}
+
+
+@pytest.fixture
+def usuario_antiguo(app):
+    with app.app_context():
+        usuario = crear_usuario('antiguo')
+        inicio = datetime(2024, 1, 1)
+        for metrica, valores in ANTERIORES.items():
+            Modelo = METRIC_MODELS[metrica]
+            for i, valor in enumerate(valores):
+                fecha = inicio + timedelta(days=i)
+                if Modelo is PresionArterial:
+                    db.session.add(Modelo(usuario_id=usuario.id, sistolica=valor[0], diastolica=valor[1], fecha=fecha))
+                else:
+                    db.session.add(Modelo(usuario_id=usuario.id, valor=valor, fecha=fecha))
+        db.session.commit()
+        return usuario.id
+
+
+def test_una_escritura_no_oculta_las_demas_metricas(app, usuario_antiguo):
+    cliente = iniciar_sesion(app, 'antiguo')
+    assert cliente.post('/agregar/ritmo_cardiaco', data={'valor': '90'}).status_code == 302
+
+    html = cliente.get('/estadisticas').get_data(as_text=True)
+    for nombre in ('Ritmo Cardíaco', 'Peso', 'Colesterol', 'Presión Sistólica', 'Presión Diastólica'):
+        assert nombre in html
+
+    esperados = {
+        'ritmo_cardiaco': [60, 70, 80, 90],
+        'peso': ANTERIORES['peso'],
+        'colesterol': ANTERIORES['colesterol'],
+        'presion_sistolica': [s for s, _ in ANTERIORES['presion_arterial']],
+        'presion_diastolica': [d for _, d in ANTERIORES['presion_arterial']],
+    }
+    with app.app_context():
+        guardadas = {e.campo: e for e in EstadisticaMetrica.query.filter_by(usuario_id=usuario_antiguo)}
+        assert set(guardadas) == {campo for campo, _ in ESTADISTICAS_CAMPOS}
+        for campo, valores in esperados.items():
+            e = guardadas[campo]
+            assert e.conteo == len(valores)
+            assert e.promedio == pytest.approx(sum(valores) / len(valores))
+            assert (e.minimo, e.maximo) == (min(valores), max(valores))
+        assert guardadas['altura'].conteo == 0
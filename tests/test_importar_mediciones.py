@@ -0,0 +1,58 @@
+"""'flask importar-mediciones': filas no válidas por separado y checkpoint en la base de datos."""
+import pytest
+
+import app as aplicacion
+from app import ImportacionCheckpoint, Peso, db
+
+
+@pytest.fixture
+def archivo(tmp_path, datos):
+    ruta = tmp_path / 'mediciones.csv'
+    filas = ['usuario_id,metrica,valor,fecha']
+    filas += [f"{datos['paciente']},peso,{70 + i},2024-03-0{i + 1}T08:00:00" for i in range(4)]
+    filas.insert(2, f"{datos['paciente']},peso,nan,2024-03-09T08:00:00")
+    ruta.write_text('\n'.join(filas) + '\n', encoding='utf-8')
+    return ruta
+
+
+def importar(app, archivo, *opciones):
+    return app.test_cli_runner().invoke(args=['importar-mediciones', str(archivo), '--lote', '2', *opciones])
+
+
+def pesos(app, datos):
+    with app.app_context():
+        return sorted(p.valor for p in Peso.query.filter(Peso.usuario_id == datos['paciente'], Peso.valor >= 70))
+
+
+def test_importa_y_no_duplica_al_repetir(app, datos, archivo):
+    resultado = importar(app, archivo)
+    assert resultado.exit_code == 0, resultado.output
+    assert '1 con errores' in resultado.output  # el 'nan'
+    assert pesos(app, datos) == [70, 71, 72, 73]
+    with app.app_context():
+        assert db.session.get(ImportacionCheckpoint, str(archivo.resolve())).filas == 5
+
+    assert importar(app, archivo).exit_code == 0
+    assert pesos(app, datos) == [70, 71, 72, 73]
+
+
+def test_checkpoint_en_la_misma_transaccion(app, datos, archivo, monkeypatch):
+    insertar = aplicacion.insertar_lote_importacion
+    llamadas = []
+
+    def falla_en_el_segundo_bloque(validas):
+        llamadas.append(validas)
+        if len(llamadas) == 2:
+            insertar(validas)
+            raise RuntimeError('caída simulada')
+        return insertar(validas)
+    monkeypatch.setattr(aplicacion, 'insertar_lote_importacion', falla_en_el_segundo_bloque)
+
+    assert importar(app, archivo).exit_code != 0
+    assert pesos(app, datos) == [70]  # el segundo bloque se deshizo entero
+    with app.app_context():
+        assert db.session.get(ImportacionCheckpoint, str(archivo.resolve())).filas == 2
+
+    monkeypatch.setattr(aplicacion, 'insertar_lote_importacion', insertar)
+    assert importar(app, archivo).exit_code == 0
+    assert pesos(app, datos) == [70, 71, 72, 73]
@@ -0,0 +1,34 @@
+"""MAX_CONTENT_LENGTH: los cuerpos demasiado grandes se rechazan sin leerlos."""
+import io
+
+from app import Consejo
+
+
+def test_imagen_demasiado_grande(app, cliente_admin, monkeypatch):
+    assert app.config['MAX_CONTENT_LENGTH'] > app.config['CONSEJO_IMAGEN_MAX_BYTES']
+    monkeypatch.setitem(app.config, 'MAX_CONTENT_LENGTH', 4096)
+    respuesta = cliente_admin.post('/admin/agregar_consejo', content_type='multipart/form-data', data={
+        'titulo': 'Grande', 'contenido': 'x', 'tema': 'General', 'imagen': (io.BytesIO(b'\0' * 10000), 'g.png')})
+    assert respuesta.status_code == 302
+    assert respuesta.headers['Location'].endswith('/admin/agregar_consejo')
+    assert 'supera el máximo' in cliente_admin.get('/admin/agregar_consejo').get_data(as_text=True)
+    with app.app_context():
+        assert Consejo.query.filter_by(titulo='Grande').count() == 0
+
+
+def test_api_devuelve_json(app, cliente_paciente, monkeypatch):
+    monkeypatch.setitem(app.config, 'MAX_CONTENT_LENGTH', 1024)
+    respuesta = cliente_paciente.post('/api/v1/mediciones/lote',
+                                      json=[{'metrica': 'peso', 'valor': 70}] * 100)
+    assert respuesta.status_code == 413
+    assert 'error' in respuesta.json
+
+
+def test_imagen_no_valida(app, cliente_admin):
+    respuesta = cliente_admin.post('/admin/agregar_consejo', content_type='multipart/form-data', data={
+        'titulo': 'Rota', 'contenido': 'x', 'tema': 'General', 'imagen': (io.BytesIO(b'no es png'), 'r.png')})
+    assert respuesta.status_code == 302
+    assert 'Imagen no válida: el archivo no es una imagen válida.' in \
+        cliente_admin.get('/admin/agregar_consejo').get_data(as_text=True)
+    with app.app_context():
+        assert Consejo.query.filter_by(titulo='Rota').count() == 0
@@ -0,0 +1,33 @@
+"""Rehash de contraseñas: solo hacia el método configurado o un coste mayor."""
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app import Usuario, db, necesita_rehash
+from conftest import crear_usuario
+
+
+@pytest.mark.parametrize('guardado, objetivo, rehacer', [
+    ('pbkdf2:sha256:1000', 'pbkdf2:sha256:1000', False),
+    ('pbkdf2:sha256:1000', 'pbkdf2:sha256:2000', True),
+    ('pbkdf2:sha256:2000', 'pbkdf2:sha256:1000', False),  # nunca se rebaja el coste
+    ('pbkdf2:sha256:1000000', 'pbkdf2:sha256', False),  # el valor por defecto de werkzeug
+    ('pbkdf2:sha256:1000', 'scrypt:1024:8:1', True),
+    ('scrypt:1024:8:1', 'scrypt:2048:8:1', True),
+    ('scrypt:2048:8:1', 'scrypt:1024:8:1', False),
+])
+def test_necesita_rehash(app, monkeypatch, guardado, objetivo, rehacer):
+    monkeypatch.setitem(app.config, 'PASSWORD_HASH_METODO', objetivo)
+    with app.app_context():
+        assert necesita_rehash(generate_password_hash('x', guardado)) is rehacer
+
+
+def test_login_no_rebaja_el_hash(app):
+    with app.app_context():
+        crear_usuario('fuerte')
+        usuario = Usuario.query.filter_by(nombre='fuerte').one()
+        usuario.password_hash = generate_password_hash('clave', 'pbkdf2:sha256:2000')
+        db.session.commit()
+
+    app.test_client().post('/login', data={'nameUser': 'fuerte', 'passwordUser': 'clave'})
+    with app.app_context():
+        assert Usuario.query.filter_by(nombre='fuerte').one().password_hash.startswith('pbkdf2:sha256:2000$')
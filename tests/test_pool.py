@@ -0,0 +1,49 @@
+"""Estadísticas del pool de conexiones con SQLite en archivo (QueuePool)."""
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+import config
+from app import Usuario, create_app, db, estadisticas_pool
+from conftest import crear_usuario, iniciar_sesion
+
+
+@pytest.fixture
+def app_pool(tmp_path, monkeypatch):
+    # Una sola conexión y sin overflow: la segunda petición simultánea agota el timeout
+    monkeypatch.setattr(config.Pruebas, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'pool.db'}")
+    monkeypatch.setattr(config.Pruebas, 'DB_POOL_SIZE', 1)
+    monkeypatch.setattr(config.Pruebas, 'DB_MAX_OVERFLOW', 0)
+    monkeypatch.setattr(config.Pruebas, 'DB_POOL_TIMEOUT', 0.1)
+    app = create_app('pruebas')
+    with app.app_context():
+        crear_usuario('admin', rol='admin')
+        db.session.commit()
+    estadisticas_pool.reiniciar()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_esperas_y_uso(app_pool):
+    cliente = iniciar_sesion(app_pool, 'admin')
+    datos = cliente.get('/admin/pool').json
+    assert datos['clase'] == 'QueuePoolContado'
+    assert (datos['pool_size'], datos['max_overflow']) == (1, 0)
+    acumulado = datos['acumulado']
+    assert acumulado['obtenidas'] >= 1 and acumulado['espera_media_ms'] is not None
+    assert acumulado['uso_medio_ms'] is not None
+    assert acumulado['en_uso_maximo'] == 1 and acumulado['timeouts'] == 0
+
+
+def test_timeout_del_pool_se_cuenta(app_pool):
+    cliente = iniciar_sesion(app_pool, 'admin')
+    with app_pool.app_context():
+        with db.engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                cliente.get('/admin/dashboard')
+            # Una ruta que captura la excepción y muestra un aviso también cuenta
+            try:
+                Usuario.query.count()
+            except Exception:
+                db.session.rollback()
+    assert estadisticas_pool.resumen()['timeouts'] == 2
@@ -0,0 +1,48 @@
+"""Recorridos por bloques (keyset) de los comandos de mantenimiento."""
+from app import Peso, RollupMetrica, UltimoRegistro, Usuario, UsuarioTrigrama, db, por_bloques
+
+
+def test_por_bloques_recorre_todo_en_orden(app, datos):
+    with app.app_context():
+        consulta = db.select(Peso.usuario_id, Peso.fecha, Peso.id, Peso.valor)
+        claves = [Peso.usuario_id, Peso.fecha, Peso.id]
+        esperadas = db.session.execute(consulta.order_by(*claves)).all()
+        leidas = []
+        for fila in por_bloques(consulta, claves, lote=3):
+            db.session.scalar(db.select(db.func.count()).select_from(Usuario))  # otra sentencia en medio
+            leidas.append(fila)
+        assert leidas == esperadas and len(leidas) == 25
+
+
+def test_reconstruir_ultimo_registro(app, datos):
+    resultado = app.test_cli_runner().invoke(args=['reconstruir-ultimo-registro'])
+    assert resultado.exit_code == 0, resultado.output
+    with app.app_context():
+        assert UltimoRegistro.query.count() == 11  # todos menos el admin, que no tiene mediciones
+
+
+def test_rellenar_rollups_coincide_con_el_incremental(app, datos):
+    def rollups():
+        with app.app_context():
+            return sorted((r.usuario_id, r.campo, r.resolucion, r.inicio, r.conteo, r.suma, r.minimo, r.maximo)
+                          for r in RollupMetrica.query)
+    incrementales = rollups()
+    resultado = app.test_cli_runner().invoke(args=['rellenar-rollups'])
+    assert resultado.exit_code == 0, resultado.output
+    assert rollups() == incrementales
+
+
+def test_verificar_cuantiles(app, datos):
+    resultado = app.test_cli_runner().invoke(args=['verificar-cuantiles'])
+    assert resultado.exit_code == 0, resultado.output
+    assert '88 sketches revisados' in resultado.output
+
+
+def test_indexar_usuarios(app, datos):
+    with app.app_context():
+        antes = sorted(db.session.execute(db.select(UsuarioTrigrama.usuario_id, UsuarioTrigrama.trigrama)).all())
+    resultado = app.test_cli_runner().invoke(args=['indexar-usuarios'])
+    assert resultado.exit_code == 0, resultado.output
+    assert '12 usuarios indexados' in resultado.output
+    with app.app_context():
+        assert sorted(db.session.execute(db.select(UsuarioTrigrama.usuario_id, UsuarioTrigrama.trigrama)).all()) == antes
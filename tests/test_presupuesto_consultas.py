@@ -0,0 +1,57 @@
+"""Presupuesto de consultas SQL por ruta y detección de N+1.
+
+Cada ruta declara el máximo de sentencias SQL que puede ejecutar con los
+datos de 'datos' (conftest.py). Si un cambio lo supera, o si una misma
+sentencia se repite con distintos parámetros (una consulta por fila), la
+prueba falla y muestra las sentencias ejecutadas.
+"""
+import pytest
+
+# (quién, url, presupuesto). 'paciente' y 'admin' son los usuarios de conftest.datos.
+PRESUPUESTOS = [
+    ('paciente', '/', 1),  # instantánea de últimas métricas + perfil (UNION ALL)
+    ('paciente', '/inicio', 0),
+    ('paciente', '/agregar', 0),
+    ('paciente', '/historial', 7),  # una página por cada una de las 7 tablas de métricas
+    ('paciente', '/historial?desde=2024-01-02&hasta=2024-01-03', 7),  # formulario de filtro por fechas
+    ('paciente', '/estadisticas', 2),  # agregados y sketches en un JOIN + series de tendencias
+    ('paciente', '/calcular_imc', 1),
+    ('paciente', '/tendencias/peso', 1),
+    ('paciente', '/historial/exportar?formato=csv', 7),  # un recorrido por tabla
+    ('paciente', '/consejos', 2),  # listado + temas (sin caché: la fixture la invalida)
+    ('paciente', '/consejos?q=nutricion', 3),  # FTS + consejos + temas
+    ('paciente', '/consejo/{consejo}', 1),  # consejo y autor en un JOIN
+    ('admin', '/admin/dashboard', 2),  # página de usuarios + actividad (UNION ALL)
+    ('admin', '/admin/dashboard?q=otro', 4),  # frecuencias + ranking de trigramas + usuarios + actividad
+    ('admin', '/admin/registros/{paciente}', 8),  # usuario + 7 tablas
+    ('admin', '/admin/editar_consejo/{consejo}', 1),
+]
+
+
+@pytest.mark.parametrize('quien, url, presupuesto', PRESUPUESTOS, ids=[f'{q}:{u}' for q, u, _ in PRESUPUESTOS])
+def test_presupuesto_de_consultas(request, datos, contar_consultas, quien, url, presupuesto):
+    cliente = request.getfixturevalue(f'cliente_{quien}')
+    url = url.format(**datos)
+
+    with contar_consultas() as consultas:
+        respuesta = cliente.get(url)
+        respuesta.get_data()  # consume las respuestas en streaming
+
+    assert respuesta.status_code == 200, respuesta.status_code
+    assert len(consultas) <= presupuesto, (
+        f'{url} ejecutó {len(consultas)} consultas (presupuesto {presupuesto}):\n{consultas.resumen()}')
+    assert not consultas.repetidas(), (
+        f'{url} repite sentencias (posible N+1):\n' +
+        '\n'.join(f'  {veces}× {sentencia[:200]}' for sentencia, veces in consultas.repetidas().items()))
+
+
+def test_detecta_n_mas_1(app, datos, contar_consultas):
+    """El detector marca un bucle que carga una relación perezosa por fila."""
+    from app import Usuario
+    with app.app_context():
+        usuarios = Usuario.query.all()
+        with contar_consultas() as consultas:
+            for usuario in usuarios:
+                usuario.ritmos_cardiacos  # lazy=True: una consulta por usuario
+    assert len(consultas) == len(usuarios)
+    assert list(consultas.repetidas().values()) == [len(usuarios)]
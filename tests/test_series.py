@@ -0,0 +1,95 @@
+"""Tendencias de /estadisticas: indicadores vectorizados y lectura de series."""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app import METRIC_MODELS, TENDENCIAS_DIAS, db, registrar_lote_metrica, series_de_usuario
+from series import SEGUNDOS_DIA, agrupar_filas, indicadores
+
+
+def test_indicadores_coinciden_con_referencia():
+    azar = np.random.default_rng(1)
+    tiempos = np.sort(azar.uniform(0, 90, 200)) * SEGUNDOS_DIA
+    valores = np.column_stack([0.3 * tiempos / SEGUNDOS_DIA + azar.normal(0, 2, 200), azar.normal(80, 5, 200)])
+
+    resultado = indicadores(tiempos, valores, ventana=7, dias_cambio=30)
+
+    dias = (tiempos - tiempos[0]) / SEGUNDOS_DIA
+    for j in range(2):
+        pendiente, _ = np.polyfit(dias, valores[:, j], 1)
+        assert resultado['pendiente_dia'][j] == pytest.approx(pendiente)
+        assert resultado['r2'][j] == pytest.approx(np.corrcoef(dias, valores[:, j])[0, 1] ** 2)
+        assert resultado['desviacion'][j] == pytest.approx(np.std(valores[:, j], ddof=1))
+        assert resultado['media_movil'][j] == pytest.approx(valores[-7:, j].mean())
+        reciente = dias > dias[-1] - 30
+        anterior = (dias > dias[-1] - 60) & ~reciente
+        assert resultado['cambio_periodo'][j] == pytest.approx(valores[reciente, j].mean() - valores[anterior, j].mean())
+    assert indicadores(np.empty(0), np.empty((0, 1))) is None
+
+
+def test_agrupar_filas():
+    filas = [(0, 1.0, 5.0, 0.0), (0, 2.0, 6.0, 0.0), (3, 1.5, 120.0, 80.0)]
+    grupos = agrupar_filas(filas, 2)
+    assert list(grupos) == [0, 3]
+    assert grupos[3][0].tolist() == [1.5] and grupos[3][1].tolist() == [[120.0, 80.0]]
+    assert agrupar_filas([], 2) == {}
+
+
+@pytest.fixture
+def recientes(app, datos):
+    """Diez lecturas de peso del paciente en los últimos días (las de 'datos' son de 2024)."""
+    ahora = datetime.utcnow().replace(microsecond=0)
+    filas = [{'usuario_id': datos['paciente'], 'valor': 70 + i, 'fecha': ahora - timedelta(days=10 - i)}
+             for i in range(10)]
+    with app.app_context():
+        db.session.execute(db.insert(METRIC_MODELS['peso']), filas)
+        registrar_lote_metrica('peso', datos['paciente'], filas)
+        db.session.commit()
+    return datos
+
+
+def test_series_iguales_en_los_dos_almacenes(app, recientes, monkeypatch):
+    with app.app_context():
+        tablas = series_de_usuario(recientes['paciente'])
+    monkeypatch.setitem(app.config, 'ALMACEN_MEDICIONES', 'unificado')
+    assert app.test_cli_runner().invoke(args=['migrar-mediciones']).exit_code == 0
+    with app.app_context():
+        unificado = series_de_usuario(recientes['paciente'])
+
+    assert list(tablas) == list(unificado) == ['peso']
+    tiempos, valores = tablas['peso']
+    assert valores[:, 0].tolist() == list(range(70, 80))
+    np.testing.assert_allclose(tiempos, unificado['peso'][0])
+    np.testing.assert_array_equal(valores, unificado['peso'][1])
+    assert (tiempos[-1] - tiempos[0]) / SEGUNDOS_DIA == pytest.approx(9)
+
+
+def test_estadisticas_muestra_tendencias(recientes, cliente_paciente):
+    html = cliente_paciente.get('/estadisticas').get_data(as_text=True)
+    assert 'Tendencias' in html
+    assert '+7.00' in html  # pendiente de 1 kg por día
+    assert 'Sube' in html
+
+
+@pytest.fixture
+def zona_no_utc(monkeypatch):
+    """El proceso en UTC-5, como un servidor con hora local distinta de UTC."""
+    monkeypatch.setenv('TZ', 'Etc/GMT+5')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_ventana_en_utc(app, datos, zona_no_utc):
+    # Una lectura justo dentro de la ventana y otra justo fuera, en la hora UTC de las escrituras
+    limite = datetime.utcnow() - timedelta(days=TENDENCIAS_DIAS)
+    filas = [{'usuario_id': datos['paciente'], 'valor': valor, 'fecha': limite + desplazamiento}
+             for valor, desplazamiento in ((81, timedelta(hours=1)), (82, timedelta(hours=-1)))]
+    with app.app_context():
+        db.session.execute(db.insert(METRIC_MODELS['peso']), filas)
+        db.session.commit()
+        tiempos, valores = series_de_usuario(datos['paciente'])['peso']
+    assert valores[:, 0].tolist() == [81]
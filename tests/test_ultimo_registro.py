@@ -0,0 +1,23 @@
+"""Snapshot 'ultimo_registro': primeras escrituras simultáneas de un usuario."""
+import app as aplicacion
+from app import UltimoRegistro, db
+from conftest import crear_usuario, iniciar_sesion
+
+
+def test_snapshot_creado_por_otra_transaccion(app, monkeypatch):
+    with app.app_context():
+        usuario_id = crear_usuario('simultaneo').id
+        db.session.commit()
+    cargar = aplicacion.cargar_ultimas_metricas
+
+    def con_otra_escritura(id_usuario):
+        # Otra primera escritura crea la fila entre nuestra lectura y nuestro INSERT
+        db.session.execute(db.insert(UltimoRegistro).values(usuario_id=id_usuario))
+        return cargar(id_usuario)
+    monkeypatch.setattr(aplicacion, 'cargar_ultimas_metricas', con_otra_escritura)
+
+    cliente = iniciar_sesion(app, 'simultaneo')
+    assert cliente.post('/agregar/peso', data={'valor': '70'}).status_code == 302
+    with app.app_context():
+        snapshot = db.session.get(UltimoRegistro, usuario_id)
+        assert snapshot.peso_valor == 70 and snapshot.peso_id is not None
@@ -0,0 +1,12 @@
+"""Punto de entrada WSGI para producción.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+El perfil se elige con APP_PERFIL (por defecto 'produccion'). Las tablas se
+crean al desplegar con 'flask --app wsgi crear-tablas', no al arrancar.
+"""
+import os
+
+from app import create_app
+
+app = create_app(os.environ.get('APP_PERFIL', 'produccion'))